@@ -3,6 +3,7 @@ Google Cloud Storage pythonic interface
 """
 
 import asyncio
+import functools
 import io
 import json
 import logging
@@ -85,6 +86,11 @@ _VALID_LIST_PARAMS = {
     "includeFoldersAsPrefixes",
 }
 
+# Used to parse each part of a multipart batch response in _rm_files
+_BATCH_STATUS_RE = re.compile("HTTP/[0-9.]+ ([0-9]+)")
+_BATCH_BODY_RE = re.compile("{(.*)}")
+_BATCH_JSON_RE = re.compile("({.*})")
+
 
 def quote(s):
     """
@@ -177,6 +183,13 @@ def _coalesce_generation(*args):
         return generations.pop()
 
 
+@functools.lru_cache(maxsize=4096)
+def _cached_parent(cls, path):
+    """Memoized ``AbstractFileSystem._parent``; listings and cache updates ask
+    for the parent of the same few directories over and over."""
+    return super(GCSFileSystem, cls)._parent(path)
+
+
 def _is_directory_marker(entry):
     return entry["size"] == 0 and entry["name"].endswith("/")
 
@@ -451,6 +464,12 @@ class GCSFileSystem(DirCacheUpdater, asyn.AsyncFileSystem):
         # use of root_marker to make minimum required path, e.g., "/"
         return path or cls.root_marker
 
+    @classmethod
+    def _parent(cls, path):
+        if isinstance(path, str):
+            return _cached_parent(cls, path)
+        return super()._parent(path)
+
     @classmethod
     def _get_kwargs_from_urls(cls, path):
         _, _, generation = cls._split_path(path, version_aware=True)
@@ -1221,10 +1240,20 @@ class GCSFileSystem(DirCacheUpdater, asyn.AsyncFileSystem):
         self, path, start=None, end=None, concurrency=DEFAULT_CONCURRENCY, **kwargs
     ):
         """Concurrent fetch of file data"""
+        if start is not None and start < 0 and end is None:
+            # Suffix reads (e.g. file footers) map to a single "bytes=-N" range
+            # request and need no size lookup.
+            return await self._cat_file_sequential(path, start=start, end=end, **kwargs)
         if start is None:
             start = 0
-        if end is None:
-            end = (await self._info(path))["size"]
+        if end is None or start < 0 or end < 0:
+            size = (await self._info(path))["size"]
+            if start < 0:
+                start = max(0, size + start)
+            if end is None:
+                end = size
+            elif end < 0:
+                end = size + end
         if start >= end:
             return b""
 
@@ -1559,7 +1588,7 @@ class GCSFileSystem(DirCacheUpdater, asyn.AsyncFileSystem):
             deleted = []
             confirmed_absent = []
             for path, response in zip(paths, responses):
-                m = re.search("HTTP/[0-9.]+ ([0-9]+)", response)
+                m = _BATCH_STATUS_RE.search(response)
                 code = int(m.groups()[0]) if m else None
                 if code in [200, 204]:
                     out.append(path)
@@ -1569,9 +1598,9 @@ class GCSFileSystem(DirCacheUpdater, asyn.AsyncFileSystem):
                 else:
                     if code == 404:
                         confirmed_absent.append(path)
-                    msg = re.search("{(.*)}", response.replace("\n", ""))
+                    msg = _BATCH_BODY_RE.search(response.replace("\n", ""))
                     if msg:
-                        msg2 = re.search("({.*})", msg.groups()[0])
+                        msg2 = _BATCH_JSON_RE.search(msg.groups()[0])
                     else:
                         msg2 = None
                     if msg and msg2:
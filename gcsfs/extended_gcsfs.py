@@ -4,6 +4,7 @@ import logging
 import os
 import uuid
 import weakref
+from collections.abc import Iterable
 from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from glob import has_magic
@@ -556,6 +557,18 @@ class ExtendedGcsFileSystem(HnsDirCacheUpdater, GCSFileSystem):
 
         return master_buffer.get_value()
 
+    async def _get_zonal_file_size(self, path, mrd_or_pool):
+        """Size of a Zonal object from its MRD, falling back to ``_info``."""
+        file_size = await _get_mrd_size(mrd_or_pool)
+        if file_size is None:
+            logger.warning(
+                f"AsyncMultiRangeDownloader (MRD) for {path} has no 'persisted_size'. "
+                "Falling back to _info() to get the file size. "
+                "This may result in incorrect behavior for unfinalized objects."
+            )
+            file_size = (await self._info(path))["size"]
+        return file_size
+
     async def _cat_file(
         self,
         path,
@@ -599,14 +612,7 @@ class ExtendedGcsFileSystem(HnsDirCacheUpdater, GCSFileSystem):
             pool_created_here = True
 
         try:
-            file_size = await _get_mrd_size(mrd)
-            if file_size is None:
-                logger.warning(
-                    f"AsyncMultiRangeDownloader (MRD) for {path} has no 'persisted_size'. "
-                    "Falling back to _info() to get the file size. "
-                    "This may result in incorrect behavior for unfinalized objects."
-                )
-                file_size = (await self._info(path))["size"]
+            file_size = await self._get_zonal_file_size(path, mrd)
 
             offset, length = await self._process_limits_to_offset_and_length(
                 path, start, end, file_size
@@ -627,6 +633,156 @@ class ExtendedGcsFileSystem(HnsDirCacheUpdater, GCSFileSystem):
             if pool_created_here:
                 await mrd.close()
 
+    async def _cat_ranges(
+        self,
+        paths,
+        starts,
+        ends,
+        max_gap=None,
+        batch_size=None,
+        on_error="return",
+        **kwargs,
+    ):
+        """Get the contents of byte ranges from one or more files.
+
+        Ranges on objects in Zonal buckets are grouped by file, and each file's
+        ranges are fetched through a single MRD with batched ``download_ranges``
+        calls rather than one ``_cat_file`` (and MRD pool lookup) per range.
+        Other paths are delegated to the parent implementation.
+        """
+        if max_gap is not None or not isinstance(paths, list):
+            return await super()._cat_ranges(
+                paths,
+                starts,
+                ends,
+                max_gap=max_gap,
+                batch_size=batch_size,
+                on_error=on_error,
+                **kwargs,
+            )
+        if not isinstance(starts, Iterable):
+            starts = [starts] * len(paths)
+        if not isinstance(ends, Iterable):
+            ends = [ends] * len(paths)
+        if len(starts) != len(paths) or len(ends) != len(paths):
+            raise ValueError
+
+        zonal_buckets = {}
+        zonal_groups = {}
+        other = []
+        for i, path in enumerate(paths):
+            bucket, _, _ = self.split_path(path)
+            if bucket not in zonal_buckets:
+                zonal_buckets[bucket] = await self._is_zonal_bucket(bucket)
+            if zonal_buckets[bucket]:
+                zonal_groups.setdefault(path, []).append(i)
+            else:
+                other.append(i)
+
+        if not zonal_groups:
+            return await super()._cat_ranges(
+                paths,
+                starts,
+                ends,
+                batch_size=batch_size,
+                on_error=on_error,
+                **kwargs,
+            )
+
+        groups = list(zonal_groups.values())
+        coros = [
+            self._cat_zonal_ranges(
+                path,
+                [starts[i] for i in indices],
+                [ends[i] for i in indices],
+                **kwargs,
+            )
+            for path, indices in zonal_groups.items()
+        ]
+        if other:
+            groups.append(other)
+            coros.append(
+                super()._cat_ranges(
+                    [paths[i] for i in other],
+                    [starts[i] for i in other],
+                    [ends[i] for i in other],
+                    batch_size=batch_size,
+                    **kwargs,
+                )
+            )
+
+        results = await asyn._run_coros_in_chunks(
+            coros,
+            batch_size=batch_size or self.batch_size,
+            nofiles=True,
+            return_exceptions=True,
+        )
+        out = [None] * len(paths)
+        for indices, res in zip(groups, results):
+            if isinstance(res, Exception):
+                # The whole file failed (e.g. it does not exist)
+                res = [res] * len(indices)
+            for i, data in zip(indices, res):
+                out[i] = data
+
+        if on_error != "return":
+            ex = next((o for o in out if isinstance(o, Exception)), None)
+            if ex is not None:
+                raise ex
+        return out
+
+    async def _cat_zonal_ranges(
+        self,
+        path,
+        starts,
+        ends,
+        concurrency=zb_hns_utils.DEFAULT_CONCURRENCY,
+        **kwargs,
+    ):
+        """Reads several byte ranges of one Zonal object through one MRD pool.
+
+        Ranges smaller than ``MIN_CHUNK_SIZE_FOR_CONCURRENCY`` are batched into
+        ``download_ranges`` calls on a single MRD. Larger ranges are split across
+        up to ``concurrency`` MRDs, as in ``_cat_file``. Other ``kwargs`` are
+        accepted for parity with ``_cat_file``, which also ignores them for Zonal
+        objects.
+        """
+        bucket, object_name, generation = self.split_path(path)
+        mrd_pool = await self._mrd_pool_cache.get(
+            bucket, object_name, generation, pool_size=concurrency
+        )
+        try:
+            file_size = await self._get_zonal_file_size(path, mrd_pool)
+            ranges = [
+                await self._process_limits_to_offset_and_length(
+                    path, start, end, file_size
+                )
+                for start, end in zip(starts, ends)
+            ]
+            small = [
+                i
+                for i, (_, length) in enumerate(ranges)
+                if length < self.MIN_CHUNK_SIZE_FOR_CONCURRENCY
+            ]
+            out = [None] * len(ranges)
+            if small:
+                async with _get_mrd_from_pool_or_mrd(mrd_pool) as mrd:
+                    for b in range(0, len(small), zb_hns_utils.MRD_MAX_RANGES):
+                        batch = small[b : b + zb_hns_utils.MRD_MAX_RANGES]
+                        data = await zb_hns_utils.download_ranges(
+                            [ranges[i] for i in batch], mrd
+                        )
+                        for i, d in zip(batch, data):
+                            out[i] = d
+            for i, (offset, length) in enumerate(ranges):
+                if out[i] is None:
+                    out[i] = await self._concurrent_mrd_fetch(
+                        offset, length, concurrency, mrd_pool
+                    )
+            return out
+        finally:
+            await mrd_pool.close()
+
     async def _is_bucket_hns_enabled(self, bucket):
         """Checks if a bucket has Hierarchical Namespace enabled."""
         try:
@@ -959,6 +1115,37 @@ class ExtendedGcsFileSystem(HnsDirCacheUpdater, GCSFileSystem):
 
     makedirs = asyn.sync_wrapper(_makedirs)
 
+    async def _exists_many(self, paths, **kwargs):
+        """Check the existence of several paths concurrently.
+
+        Issues one ``_info`` call per path and gathers them, so checking N
+        paths costs a single round trip of the event loop instead of N.
+
+        Parameters
+        ----------
+        paths : list of str
+            Paths to check.
+
+        Returns
+        -------
+        list of bool
+            Whether each path exists, in the same order as ``paths``.
+        """
+        infos = await asyncio.gather(
+            *(self._info(path, **kwargs) for path in paths), return_exceptions=True
+        )
+        results = []
+        for info in infos:
+            if isinstance(info, FileNotFoundError):
+                results.append(False)
+            elif isinstance(info, BaseException):
+                raise info
+            else:
+                results.append(True)
+        return results
+
+    exists_many = asyn.sync_wrapper(_exists_many)
+
     async def _get_directory_info(self, path, bucket, key, generation):
         """
         Override to use Storage Control API's get_folder for HNS buckets.
@@ -1649,9 +1836,14 @@ class ExtendedGcsFileSystem(HnsDirCacheUpdater, GCSFileSystem):
         # Works for both 'overwrite' and 'create' modes
         writer = await zb_hns_utils.init_aaow(self.grpc_client, bucket, key)
         try:
-            with memoryview(data) as data_view:
-                for i in range(0, len(data_view), chunksize):
-                    await writer.append(data_view[i : i + chunksize])
+            if isinstance(data, bytes) and len(data) <= chunksize:
+                # append() wraps its input in a BytesIO, which shares a bytes
+                # object but copies any other buffer, memoryviews included.
+                await writer.append(data)
+            else:
+                with memoryview(data) as data_view:
+                    for i in range(0, len(data_view), chunksize):
+                        await writer.append(data_view[i : i + chunksize])
         finally:
             finalize_on_close = kwargs.get("finalize_on_close", self.finalize_on_close)
             await zb_hns_utils.close_aaow(writer, finalize_on_close=finalize_on_close)
@@ -433,6 +433,10 @@ class PrefetchConsumer:
     exact byte sizes requested by the user. It also manages the local block buffer.
     """
 
+    # Copies smaller than this are done on the event loop. Below ~1MB the
+    # thread hop of asyncio.to_thread costs more than the copy itself.
+    MIN_THREAD_COPY_SIZE = 1024 * 1024
+
     def __init__(
         self,
         queue: asyncio.Queue,
@@ -565,6 +569,10 @@ class PrefetchConsumer:
             if save_data:
                 if take == len(self._current_block) and self._current_block_idx == 0:
                     chunk = self._current_block
+                elif take < self.MIN_THREAD_COPY_SIZE:
+                    chunk = _fast_slice(
+                        self._current_block, self._current_block_idx, take
+                    )
                 else:
                     # Native Python slicing was GIL bound in my experiments.
                     chunk = await asyncio.to_thread(
@@ -606,6 +614,9 @@ class PrefetchConsumer:
         if len(chunks) == 1:
             return chunks[0]
 
+        if size < self.MIN_THREAD_COPY_SIZE:
+            return b"".join(chunks)
+
         return await asyncio.to_thread(b"".join, chunks)
 
     async def skip(self, size: int) -> None:
@@ -1,3 +1,4 @@
+import io
 import logging
 import os
 import shlex
@@ -51,8 +52,9 @@ requires_hns = pytest.mark.skipif(
     not is_extended_support or (is_real_gcs_bucket and not is_hns_bucket),
     reason="Requires HNS support and GCSFS_EXPERIMENTAL_ZB_HNS_SUPPORT to be enabled",
 )
+runs_rapid_tests = is_extended_support and (not is_real_gcs_bucket or is_rapid_bucket)
 requires_rapid = pytest.mark.skipif(
-    not is_extended_support or (is_real_gcs_bucket and not is_rapid_bucket),
+    not runs_rapid_tests,
     reason="Requires zonal support and GCSFS_EXPERIMENTAL_ZB_HNS_SUPPORT to be enabled",
 )
 
@@ -80,6 +82,8 @@ csv_files = {
         b"name,amount,id\n" b"Dennis,400,4\n" b"Edith,500,5\n" b"Frank,600,6\n"
     ),
 }
+# Lines of a file whose middle line spans a whole 2**18 block, for readline tests.
+blocksize_lines = (b"ab\n", b"a" * (2**18) + b"\n", b"ab")
 text_files = {
     "nested/file1": b"hello\n",
     "nested/file2": b"world",
@@ -87,7 +91,7 @@ text_files = {
     "nested/nested2/file2": b"world",
     "zonal/test/a": b"a,b\n11,22\n3,4",
     "zonal/test/b": b"",
-    "zonal/test/c": b"ab\n" + b"a" * (2**18) + b"\nab",
+    "zonal/test/c": b"".join(blocksize_lines),
 }
 
 allfiles = dict(**files, **csv_files, **text_files)
@@ -254,6 +258,50 @@ def populate_bucket():
     return True
 
 
+@pytest.fixture(scope="session")
+def json_data():
+    return files["test/accounts.1.json"]
+
+
+@pytest.fixture(scope="session")
+def lines(json_data):
+    return io.BytesIO(json_data).readlines()
+
+
+@pytest.fixture(scope="session")
+def file_size(json_data):
+    return len(json_data)
+
+
+@pytest.fixture(scope="session")
+def read_block_params(json_data, lines, file_size):
+    """read_block cases keyed by test id, as ``(offset, length, delimiter, expected)``.
+
+    Built once per session, and only when a read_block test runs.
+    """
+    return {
+        # Read specific chunk
+        "offset=3, length=10": (3, 10, None, json_data[3 : 3 + 10]),
+        # Read from beginning up to length
+        "offset=0, length=5": (0, 5, None, json_data[0:5]),
+        # Read from offset to end (simulate large length)
+        "offset=15, length=large": (15, 5000, None, json_data[15:]),
+        # Read beyond end of file (should return empty bytes)
+        "offset>size, length=5": (file_size + 10, 5, None, b""),
+        # Read exactly at the end (zero length)
+        "offset=size, length=10": (file_size, 10, None, b""),
+        # Read with delimiter
+        "offset=1, length=35, delimiter=newline": (1, 35, b"\n", lines[1]),
+        "offset=0, length=30, delimiter=newline": (0, 30, b"\n", lines[0]),
+        "offset=0, length=35, delimiter=newline": (
+            0,
+            35,
+            b"\n",
+            lines[0] + lines[1],
+        ),
+    }
+
+
 @pytest.fixture
 def gcs(gcs_factory, buckets_to_delete, populate_bucket):
     gcs = gcs_factory()
@@ -306,16 +354,41 @@ def extended_gcs_factory(gcs_factory, buckets_to_delete, populate_bucket):
         _close_gcs(fs)
 
 
+@pytest.fixture(scope="session")
+def _shared_extended_gcsfs(gcs_factory, buckets_to_delete):
+    """
+    Session-scoped registry of ExtendedGcsFileSystem instances, keyed by the
+    `populate_bucket` value they were created with.
+
+    Sharing one instance across tests reuses its event loop, HTTP connection
+    pool and storage-control client instead of rebuilding them per test.
+    """
+    instances = {}
+
+    def get(populate_bucket):
+        if populate_bucket not in instances:
+            instances[populate_bucket] = _create_extended_gcsfs(
+                gcs_factory, buckets_to_delete, populate_bucket
+            )
+        return instances[populate_bucket]
+
+    yield get
+
+    for fs in instances.values():
+        _close_gcs(fs)
+
+
 @pytest.fixture
-def extended_gcsfs(gcs_factory, buckets_to_delete, populate_bucket):
-    extended_gcsfs = _create_extended_gcsfs(
-        gcs_factory, buckets_to_delete, populate_bucket
-    )
+def extended_gcsfs(_shared_extended_gcsfs, populate_bucket):
+    extended_gcsfs = _shared_extended_gcsfs(populate_bucket)
+    # Tests mock the bucket type, so drop any layout resolved by an earlier test.
+    extended_gcsfs._storage_layout_cache.clear()
+    extended_gcsfs.invalidate_cache()
     try:
         yield extended_gcsfs
     finally:
         _cleanup_gcs(extended_gcsfs, bucket_populated=populate_bucket)
-        _close_gcs(extended_gcsfs)
+        extended_gcsfs.invalidate_cache()
 
 
 def _cleanup_gcs(gcs, bucket=TEST_BUCKET, bucket_populated=True):
@@ -534,8 +607,19 @@ def flat_bucket(flat_bucket_name, gcs_factory):
         _close_gcs(gcs)
 
 
+@pytest.fixture(scope="session")
+def _zonal_write_mock_objects():
+    """Builds the Zonal write mocks once; zonal_write_mocks resets them per test."""
+    return {
+        "aaow": mock.AsyncMock(spec=AsyncAppendableObjectWriter),
+        "init_aaow": mock.AsyncMock(),
+        "_gcsfs_info": mock.AsyncMock(),
+        "_gcsfs_get_object": mock.AsyncMock(),
+    }
+
+
 @pytest.fixture
-def zonal_write_mocks():
+def zonal_write_mocks(_zonal_write_mock_objects):
     """A fixture for mocking Zonal bucket write functionality."""
 
     if is_real_gcs():
@@ -547,14 +631,25 @@ def zonal_write_mocks():
     )
     patch_target_init_aaow = "gcsfs.zb_hns_utils.init_aaow"
     patch_target_gcsfs_info = "gcsfs.core.GCSFileSystem._info"
+    patch_target_gcsfs_get_object = "gcsfs.core.GCSFileSystem._get_object"
+
+    # Resetting the shared mocks is much cheaper than building new spec'd
+    # mocks for every test; return values and side effects are reset too
+    # since tests override them.
+    mocks = _zonal_write_mock_objects
+    for m in mocks.values():
+        m.reset_mock(return_value=True, side_effect=True)
 
-    mock_aaow = mock.AsyncMock(spec=AsyncAppendableObjectWriter)
+    mock_aaow = mocks["aaow"]
     mock_aaow.offset = 0
     mock_aaow._is_stream_open = True
-    mock_init_aaow = mock.AsyncMock(return_value=mock_aaow)
-    mock_gcsfs_info = mock.AsyncMock(
-        return_value={"generation": "12345", "type": "file", "name": "mock_file"}
-    )
+    mocks["init_aaow"].return_value = mock_aaow
+    mocks["_gcsfs_info"].return_value = {
+        "generation": "12345",
+        "type": "file",
+        "name": "mock_file",
+    }
+    mocks["_gcsfs_get_object"].return_value = mocks["_gcsfs_info"].return_value
 
     async def append_side_effect(data):
         mock_aaow.offset += len(data)
@@ -577,14 +672,10 @@ def zonal_write_mocks():
             patch_target_get_bucket_type,
             return_value=BucketType.ZONAL_HIERARCHICAL,
         ),
-        mock.patch(patch_target_gcsfs_info, mock_gcsfs_info),
-        mock.patch(patch_target_init_aaow, mock_init_aaow),
+        mock.patch(patch_target_gcsfs_info, mocks["_gcsfs_info"]),
+        mock.patch(patch_target_gcsfs_get_object, mocks["_gcsfs_get_object"]),
+        mock.patch(patch_target_init_aaow, mocks["init_aaow"]),
     ):
-        mocks = {
-            "aaow": mock_aaow,
-            "init_aaow": mock_init_aaow,
-            "_gcsfs_info": mock_gcsfs_info,
-        }
         yield mocks
 
 
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import multiprocessing
 import os
@@ -7,12 +8,24 @@ import tempfile
 import time
 import uuid
 from typing import Any, List
+from unittest import mock
 
+import aiohttp
 import pytest
+from fsspec.asyn import sync
 
+from gcsfs.core import initiate_upload, upload_chunk
 from gcsfs.tests.perf._common.resource_monitor import ResourceMonitor
+from gcsfs.tests.settings import BENCHMARK_CONNECTION_LIMIT
 
 MB = 1024 * 1024
+# Maximum number of in-flight read/write requests issued by benchmark setup.
+# Each verb has its own limit so queued writes never delay reads.
+READ_CONCURRENCY = 64
+WRITE_CONCURRENCY = 64
+# Files up to this size are uploaded concurrently from a single shared buffer;
+# larger files are generated and written by a process pool.
+SETUP_ASYNC_MAX_FILE_SIZE = 16 * MB
 
 
 def _format_mb(value):
@@ -21,6 +34,29 @@ def _format_mb(value):
     return f"{float(value) / MB:.2f}"
 
 
+async def _pooled_get_client(**kwargs):
+    """Create the aiohttp session with a connection pool sized for benchmarks.
+
+    aiohttp defaults to 100 connections with a short keep-alive, so highly
+    threaded benchmarks can queue on the pool or pay a fresh TLS handshake
+    per request after idle gaps.
+    """
+    if "connector" not in kwargs:
+        kwargs["connector"] = aiohttp.TCPConnector(
+            limit=BENCHMARK_CONNECTION_LIMIT,
+            ttl_dns_cache=600,
+            keepalive_timeout=120,
+        )
+    return aiohttp.ClientSession(**kwargs)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def pooled_http_session():
+    """Route every benchmark filesystem session through `_pooled_get_client`."""
+    with mock.patch("gcsfs.core.get_client", _pooled_get_client):
+        yield
+
+
 @pytest.fixture
 def gcsfs_benchmark_glob(extended_gcs_factory, request):
     """
@@ -57,10 +93,33 @@ def _random_chunks(total_size, max_chunk=100 * MB):
         remaining -= write_size
 
 
+async def _stream_upload(gcs, path, chunks, size):
+    """Upload ``chunks`` to a standard bucket as one resumable upload.
+
+    Each chunk is posted to the upload session as-is, skipping the copy into
+    the GCSFile write buffer. Every chunk except the last must be a multiple
+    of 256 KiB.
+    """
+    bucket, key, _ = gcs.split_path(path)
+    location = await initiate_upload(gcs, bucket, key)
+    offset = 0
+    for chunk in chunks:
+        await upload_chunk(
+            gcs, location, chunk, offset, size, "application/octet-stream"
+        )
+        offset += len(chunk)
+
+
 def _write_file(gcs, path, file_size, chunk_size):
-    with gcs.open(path, "wb", finalize_on_close=True) as f:
-        for chunk in _random_chunks(file_size, chunk_size):
-            f.write(chunk)
+    bucket, _, _ = gcs.split_path(path)
+    chunks = _random_chunks(file_size, chunk_size)
+    if sync(gcs.loop, gcs._is_zonal_bucket, bucket):
+        # Zonal writes already append each chunk straight to the stream.
+        with gcs.open(path, "wb", finalize_on_close=True) as f:
+            for chunk in chunks:
+                f.write(chunk)
+    else:
+        sync(gcs.loop, _stream_upload, gcs, path, chunks, file_size)
 
     actual_size = gcs.info(path)["size"]
     if actual_size != file_size:
@@ -79,6 +138,22 @@ def _init_pool_worker():
         patch.start()
 
 
+def _gather_bounded(gcs, coro_fn, items, limit):
+    """Run ``coro_fn(item)`` for every item on the filesystem loop, with at
+    most ``limit`` calls in flight, and return the results in order."""
+
+    async def _run_all():
+        sem = asyncio.Semaphore(limit)
+
+        async def _run_one(item):
+            async with sem:
+                return await coro_fn(item)
+
+        return await asyncio.gather(*(_run_one(item) for item in items))
+
+    return sync(gcs.loop, _run_all)
+
+
 def _prepare_files(gcs, file_paths, file_size=0):
     if file_size == 0:
         try:
@@ -87,6 +162,26 @@ def _prepare_files(gcs, file_paths, file_size=0):
         except Exception as e:
             pytest.fail(f"Failed to pipe files: {e}")
 
+    if file_size <= SETUP_ASYNC_MAX_FILE_SIZE:
+        data = b"".join(_random_chunks(file_size))
+        try:
+            _gather_bounded(
+                gcs,
+                lambda path: gcs._pipe_file(path, data, finalize_on_close=True),
+                file_paths,
+                WRITE_CONCURRENCY,
+            )
+            infos = _gather_bounded(gcs, gcs._info, file_paths, READ_CONCURRENCY)
+        except Exception as e:
+            pytest.fail(f"Failed to pipe files: {e}")
+        for path, info in zip(file_paths, infos):
+            if info["size"] != file_size:
+                pytest.fail(
+                    f"Data integrity check failed for {path}. "
+                    f"Expected size: {file_size}, Actual size: {info['size']}"
+                )
+        return
+
     chunk_size = min(100 * MB, file_size)
     pool_size = 16
 
@@ -100,8 +195,12 @@ def _prepare_files(gcs, file_paths, file_size=0):
 
 
 def _prepare_folders(gcs, folder_paths):
-    for path in folder_paths:
-        gcs.mkdir(path, create_parents=True)
+    _gather_bounded(
+        gcs,
+        lambda path: gcs._mkdir(path, create_parents=True),
+        folder_paths,
+        WRITE_CONCURRENCY,
+    )
 
 
 def _write_local_file(path, file_size):
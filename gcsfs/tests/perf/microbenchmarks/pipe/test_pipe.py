@@ -1,6 +1,8 @@
+import gzip
 import logging
 import os
 import time
+import uuid
 from concurrent.futures import ThreadPoolExecutor
 
 import pytest
@@ -11,14 +13,36 @@ from gcsfs.tests.perf.microbenchmarks.runner import (
     run_multi_process,
     run_single_threaded,
 )
+from gcsfs.tests.settings import BENCHMARK_COMPRESSED
 
 BENCHMARK_GROUP = "pipe"
 
 
-def _pipe_op(gcs, file_path, data_buffer, chunk_size):
+def _make_payload(file_size):
+    """Build the data buffer and fixed-key metadata for a pipe benchmark.
+
+    With ``--compressed`` the payload is a repeated uuid hex string, gzipped
+    up front and uploaded with ``contentEncoding=gzip``. Far fewer bytes go
+    over the wire, so the benchmark measures client overhead rather than
+    network throughput. Zonal buckets ignore ``fixed_key_metadata``, so
+    compressed runs skip the zonal cases (see ``PipeConfigurator``).
+    """
+    if not BENCHMARK_COMPRESSED:
+        return os.urandom(file_size), None
+    pattern = uuid.uuid4().hex.encode()
+    raw = (pattern * (file_size // len(pattern) + 1))[:file_size]
+    return gzip.compress(raw, compresslevel=1), {"content_encoding": "gzip"}
+
+
+def _pipe_op(gcs, file_path, data_buffer, chunk_size, fixed_key_metadata=None):
     """Pipe data buffer to a single file."""
     try:
-        gcs.pipe(file_path, data_buffer, chunksize=chunk_size)
+        gcs.pipe(
+            file_path,
+            data_buffer,
+            chunksize=chunk_size,
+            fixed_key_metadata=fixed_key_metadata,
+        )
     except Exception as e:
         logging.error(f"Error piping to {file_path}: {e}")
         raise
@@ -38,13 +62,14 @@ def test_pipe_single_threaded(benchmark, gcsfs_benchmark_pipe, monitor):
     gcs, file_paths, params = gcsfs_benchmark_pipe
 
     # Generate data buffer once outside the timed benchmark execution
-    data_buffer = os.urandom(params.file_size_bytes)
+    data_buffer, fixed_key_metadata = _make_payload(params.file_size_bytes)
 
     op_args = (
         gcs,
         file_paths[0],
         data_buffer,
         params.chunk_size_bytes,
+        fixed_key_metadata,
     )
     run_single_threaded(
         benchmark,
@@ -68,7 +93,7 @@ def _process_worker(
     """A worker function for each process to pipe files concurrently."""
 
     # Generate data buffer efficiently per process
-    data_buffer = os.urandom(file_size)
+    data_buffer, fixed_key_metadata = _make_payload(file_size)
 
     start_time = time.perf_counter()
 
@@ -80,6 +105,7 @@ def _process_worker(
                 file_paths[i],
                 data_buffer,
                 chunk_size,
+                fixed_key_metadata,
             )
             for i in range(threads)
         ]
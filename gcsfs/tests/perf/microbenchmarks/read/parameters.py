@@ -9,7 +9,7 @@ class ReadBenchmarkParameters(IOBenchmarkParameters):
     Defines the parameters for a read benchmark test cases with runtime.
     """
 
-    # Read pattern: "seq" for sequential, "rand" for random.
+    # Read pattern: "seq" for sequential, "rand" for random, "footer" for suffix reads.
     pattern: str
 
     # The block size for gcsfs file buffering default to 16MB.
@@ -110,6 +110,23 @@ def _read_op_reopen(
     return total_bytes_read
 
 
+def _read_op_footer(gcs, file_paths, chunk_size, runtime):
+    """Read the last ``chunk_size`` bytes of each file for a fixed duration.
+
+    This mirrors how Parquet/ORC readers fetch file footers, issuing a single
+    suffix range request per read.
+    """
+    total_bytes_read = 0
+    start_time = time.perf_counter()
+    files_it = itertools.cycle(file_paths)
+
+    while time.perf_counter() - start_time < runtime:
+        path = next(files_it)
+        data = gcs.cat_file(path, start=-chunk_size)
+        total_bytes_read += len(data)
+    return total_bytes_read
+
+
 def _random_read_worker(
     gcs, file_paths, chunk_size, offsets, runtime, block_size, mrd_pool_size=None
 ):
@@ -195,6 +212,9 @@ def _build_read_worker(params, gcs, file_paths):
             block_size,
             mrd_pool_size,
         )
+    elif params.pattern == "footer":
+        op = _read_op_footer
+        op_args = (gcs, file_paths, params.chunk_size_bytes, params.runtime)
     elif params.pattern == "mixed":
         op = _read_op_mixed
         op_args = (
@@ -272,6 +292,17 @@ def _process_worker_fixed_duration(
                 )
                 for _ in range(threads)
             ]
+        elif pattern == "footer":
+            futures = [
+                executor.submit(
+                    _read_op_footer,
+                    gcs,
+                    file_paths,
+                    chunk_size,
+                    runtime,
+                )
+                for _ in range(threads)
+            ]
         elif pattern == "mixed":
             futures = [
                 executor.submit(
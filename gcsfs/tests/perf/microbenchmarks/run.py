@@ -47,6 +47,9 @@ def _setup_environment(args):
     if args.config:
         os.environ["GCSFS_BENCHMARK_FILTER"] = ",".join(args.config)
 
+    if args.compressed:
+        os.environ["GCSFS_BENCHMARK_COMPRESSED"] = "true"
+
 
 def _run_benchmarks(results_dir, args):
     """Execute the benchmark suite using pytest.
@@ -354,6 +357,11 @@ def main():
         "--hns-bucket",
         help="Name of the HNS GCS bucket to use for benchmarks.",
     )
+    parser.add_argument(
+        "--compressed",
+        action="store_true",
+        help="Upload gzip-compressed, highly compressible payloads with contentEncoding=gzip.",
+    )
     parser.add_argument(
         "--log",
         default="false",
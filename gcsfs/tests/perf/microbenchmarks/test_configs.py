@@ -14,6 +14,7 @@ from gcsfs.tests.perf.microbenchmarks.listing.configs import (
     get_listing_benchmark_cases,
 )
 from gcsfs.tests.perf.microbenchmarks.open.configs import get_open_benchmark_cases
+from gcsfs.tests.perf.microbenchmarks.pipe.configs import PipeConfigurator
 from gcsfs.tests.perf.microbenchmarks.put.configs import (
     PutConfigurator,
     get_put_benchmark_cases,
@@ -134,6 +135,19 @@ def test_read_fixed_duration_multi_thread_config(mock_config_dependencies):
     assert {case.files for case in multi_thread_cases} == {1}
 
 
+def test_read_footer_config(mock_config_dependencies):
+    """Test that footer read cases read a 16 KB suffix across single and multi-thread runs."""
+    with mock.patch("gcsfs.tests.perf.microbenchmarks.configs.BENCHMARK_FILTER", ""):
+        cases = get_read_benchmark_cases()
+
+    footer_cases = [case for case in cases if case.pattern == "footer"]
+    single_thread_cases, multi_thread_cases, _ = filter_test_cases(footer_cases)
+
+    assert single_thread_cases and multi_thread_cases
+    assert {case.chunk_size_bytes for case in footer_cases} == {16 * 1024}
+    assert {case.files for case in footer_cases} == {16}
+
+
 def test_write_configurator(mock_config_dependencies):
     """Test that WriteConfigurator correctly builds benchmark parameters."""
     common = {
@@ -184,6 +198,33 @@ def test_put_configurator(mock_config_dependencies):
     assert case.bucket_name == "test-bucket"
 
 
+@pytest.mark.parametrize("compressed", [False, True])
+def test_pipe_configurator_zonal_cases(mock_config_dependencies, compressed):
+    """Test that PipeConfigurator drops zonal cases for compressed payloads."""
+    common = {
+        "bucket_types": ["regional", "zonal"],
+        "file_sizes_mb": [200],
+        "chunk_sizes_mb": [50],
+        "rounds": 1,
+    }
+    scenario = {"name": "pipe_test"}
+
+    with (
+        mock.patch(
+            "gcsfs.tests.perf.microbenchmarks.configs.BUCKET_NAME_MAP",
+            {"regional": "test-bucket", "zonal": "test-zonal-bucket"},
+        ),
+        mock.patch(
+            "gcsfs.tests.perf.microbenchmarks.pipe.configs.BENCHMARK_COMPRESSED",
+            compressed,
+        ),
+    ):
+        cases = PipeConfigurator("dummy").build_cases(scenario, common)
+
+    expected = ["regional"] if compressed else ["regional", "zonal"]
+    assert [case.bucket_type for case in cases] == expected
+
+
 def test_listing_configurator(mock_config_dependencies):
     """Test that ListingConfigurator correctly builds benchmark parameters."""
     common = {"bucket_types": ["regional"], "rounds": 1}
@@ -0,0 +1,113 @@
+import asyncio
+from unittest import mock
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from fsspec.asyn import get_loop
+
+from gcsfs.tests.perf.microbenchmarks import conftest
+from gcsfs.tests.settings import BENCHMARK_CONNECTION_LIMIT
+
+
+def test_pooled_get_client_configures_connector():
+    async def _check():
+        session = await conftest._pooled_get_client()
+        try:
+            assert session.connector.limit == BENCHMARK_CONNECTION_LIMIT
+            assert session.connector._keepalive_timeout == 120
+        finally:
+            await session.close()
+
+    asyncio.run(_check())
+
+
+def test_pooled_get_client_reuses_connections():
+    async def handler(request):
+        return web.Response(body=b"ok")
+
+    async def _check():
+        app = web.Application()
+        app.router.add_get("/", handler)
+        async with TestServer(app) as server:
+            session = await conftest._pooled_get_client()
+            connector = session.connector
+            created = 0
+            original_create_connection = connector._create_connection
+
+            async def counting_create_connection(*args, **kwargs):
+                nonlocal created
+                created += 1
+                return await original_create_connection(*args, **kwargs)
+
+            connector._create_connection = counting_create_connection
+            try:
+                for _ in range(5):
+                    async with session.get(server.make_url("/")) as resp:
+                        assert await resp.read() == b"ok"
+            finally:
+                await session.close()
+            assert created == 1
+
+    asyncio.run(_check())
+
+
+class _FakeAsyncGCS:
+    def __init__(self):
+        self.loop = get_loop()
+        self.written = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _pipe_file(self, path, data, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.written[path] = len(data)
+        self.in_flight -= 1
+
+    async def _info(self, path):
+        return {"size": self.written[path]}
+
+
+def test_prepare_files_uploads_small_files_concurrently():
+    gcs = _FakeAsyncGCS()
+    paths = [f"bucket/file_{i}" for i in range(conftest.WRITE_CONCURRENCY * 2)]
+
+    conftest._prepare_files(gcs, paths, file_size=1024)
+
+    assert gcs.written == {path: 1024 for path in paths}
+    assert 1 < gcs.max_in_flight <= conftest.WRITE_CONCURRENCY
+
+
+def test_prepare_files_fails_on_size_mismatch():
+    gcs = _FakeAsyncGCS()
+
+    async def _short_info(path):
+        return {"size": 0}
+
+    gcs._info = _short_info
+
+    with pytest.raises(pytest.fail.Exception, match="Data integrity check failed"):
+        conftest._prepare_files(gcs, ["bucket/file_0"], file_size=1024)
+
+
+def test_stream_upload_posts_each_chunk_at_its_offset():
+    gcs = mock.Mock()
+    gcs.split_path.return_value = ("bucket", "key", None)
+    chunks = [b"a" * 4, b"b" * 4, b"c" * 2]
+
+    with (
+        mock.patch.object(
+            conftest, "initiate_upload", mock.AsyncMock(return_value="loc")
+        ) as mock_initiate,
+        mock.patch.object(conftest, "upload_chunk", mock.AsyncMock()) as mock_upload,
+    ):
+        asyncio.run(conftest._stream_upload(gcs, "bucket/key", iter(chunks), 10))
+
+    mock_initiate.assert_awaited_once_with(gcs, "bucket", "key")
+    assert [c.args[2:5] for c in mock_upload.await_args_list] == [
+        (b"a" * 4, 0, 10),
+        (b"b" * 4, 4, 10),
+        (b"c" * 2, 8, 10),
+    ]
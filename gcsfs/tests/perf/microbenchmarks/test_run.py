@@ -13,6 +13,7 @@ def test_setup_environment_success():
         zonal_bucket="zonal",
         hns_bucket="hns",
         config=["conf1"],
+        compressed=True,
     )
     # Clear relevant env vars to ensure clean state
     with mock.patch.dict(os.environ, {}, clear=True):
@@ -21,6 +22,7 @@ def test_setup_environment_success():
         assert os.environ["GCSFS_ZONAL_TEST_BUCKET"] == "zonal"
         assert os.environ["GCSFS_HNS_TEST_BUCKET"] == "hns"
         assert os.environ["GCSFS_BENCHMARK_FILTER"] == "conf1"
+        assert os.environ["GCSFS_BENCHMARK_COMPRESSED"] == "true"
         assert os.environ["GCSFS_EXPERIMENTAL_ZB_HNS_SUPPORT"] == "true"
 
 
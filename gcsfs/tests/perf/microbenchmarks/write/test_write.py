@@ -15,12 +15,10 @@ from gcsfs.tests.perf.microbenchmarks.write.configs import get_write_benchmark_c
 BENCHMARK_GROUP = "write"
 
 
-def _write_op_seq_fixed_duration(gcs, file_path, chunk_size, runtime):
+def _write_op_seq_fixed_duration(gcs, file_path, data_chunk, runtime):
     """Write to a single file sequentially for a fixed duration."""
     total_bytes_written = 0
-
-    # Pre-generate chunk to avoid overhead during write loop
-    data_chunk = os.urandom(chunk_size)
+    chunk_size = len(data_chunk)
     start_time = time.perf_counter()
     try:
         with gcs.open(file_path, "wb") as f:
@@ -47,10 +45,13 @@ single_threaded_cases, _, multi_process_cases = filter_test_cases(all_benchmark_
 def test_write_single_threaded(benchmark, gcsfs_benchmark_write, monitor):
     gcs, file_paths, params = gcsfs_benchmark_write
 
+    # Generate the chunk once so every round writes the same buffer
+    data_chunk = os.urandom(params.chunk_size_bytes)
+
     op_args = (
         gcs,
         file_paths[0],
-        params.chunk_size_bytes,
+        data_chunk,
         params.runtime,
     )
     run_single_threaded_fixed_duration(
@@ -73,13 +74,16 @@ def _process_worker_fixed_duration(
     runtime,
 ):
     """A worker function for each process to write files for a fixed duration."""
+    # Generate the chunk once per process and share it across threads
+    data_chunk = os.urandom(chunk_size)
+
     with ThreadPoolExecutor(max_workers=threads) as executor:
         futures = [
             executor.submit(
                 _write_op_seq_fixed_duration,
                 gcs,
                 file_paths[i],
-                chunk_size,
+                data_chunk,
                 runtime,
             )
             for i in range(threads)
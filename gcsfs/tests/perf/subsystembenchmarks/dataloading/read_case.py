@@ -90,10 +90,13 @@ def run_read_case(benchmark, monitor, params, driver, *, bucket_ctx=None):
         )
 
         expected_rows = manifest["sample_count"]
+        # Take a single wall-clock snapshot for the window start and derive the
+        # end from the monotonic clock, so an NTP step mid-run cannot skew it.
         window_start = time.time()
+        start_ns = time.perf_counter_ns()
         with monitor() as m:
             result = driver.run_read(prefix, params)
-        window_end = time.time()
+        window_end = window_start + (time.perf_counter_ns() - start_ns) / 1e9
 
         for rows in result.rows_per_epoch:
             if rows != expected_rows:
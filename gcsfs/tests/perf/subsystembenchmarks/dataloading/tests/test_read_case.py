@@ -210,3 +210,34 @@ def test_run_read_case_rejects_unsupported_format(tmp_path):
             _JsonOnly(rows=10),
             bucket_ctx=_local_bucket_ctx(tmp_path),
         )
+
+
+def test_run_read_case_window_ignores_wall_clock_steps(tmp_path, monkeypatch):
+    """The measurement window end is derived from the monotonic clock."""
+    from gcsfs.tests.perf.subsystembenchmarks.dataloading import datagen
+
+    man = {
+        "file_count": 2,
+        "corpus_bytes": 1000,
+        "sample_count": 10,
+        "fmt": "pretok_parquet",
+        "rows_per_file": 5,
+    }
+    monkeypatch.setattr(datagen, "ingest_dataset", lambda *a, **k: man)
+    monkeypatch.setattr(read_case, "assert_fsspec_gcsfs", lambda prefix: None)
+    # A wall clock that steps backwards on every read must not invert the window.
+    wall = iter([2000.0, 1000.0])
+    monkeypatch.setattr(read_case.time, "time", lambda: next(wall))
+
+    bench = _Bench()
+    read_case.run_read_case(
+        bench,
+        _Monitor(),
+        _params(),
+        _FakeDriver(rows=10),
+        bucket_ctx=_local_bucket_ctx(tmp_path),
+    )
+    start = bench.extra_info["measurement_window_start_unix_seconds"]
+    end = bench.extra_info["measurement_window_end_unix_seconds"]
+    assert start == 2000
+    assert end >= start
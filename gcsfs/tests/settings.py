@@ -1,4 +1,5 @@
 import os
+from types import MappingProxyType
 
 
 def _get_bucket_name(env_var: str, default_name: str) -> str:
@@ -7,29 +8,69 @@ def _get_bucket_name(env_var: str, default_name: str) -> str:
     return os.getenv(env_var, default_name) + suffix
 
 
-TEST_BUCKET = _get_bucket_name("GCSFS_TEST_BUCKET", "gcsfs_test")
-TEST_VERSIONED_BUCKET = _get_bucket_name(
-    "GCSFS_TEST_VERSIONED_BUCKET", "gcsfs_test_versioned"
-)
-TEST_HNS_BUCKET = _get_bucket_name("GCSFS_HNS_TEST_BUCKET", "gcsfs_hns_test")
-TEST_ZONAL_BUCKET = _get_bucket_name("GCSFS_ZONAL_TEST_BUCKET", "gcsfs_zonal_test")
-TEST_PROJECT = os.getenv("GCSFS_TEST_PROJECT", "project")
-TEST_REGION = os.getenv("GCSFS_TEST_REGION", "us-central1")
-TEST_REQUESTER_PAYS_BUCKET = _get_bucket_name(
-    "GCSFS_TEST_REQ_PAYS_BUCKET", "gcsfs_test_req_pays"
-)
-TEST_HNS_REQUESTER_PAYS_BUCKET = _get_bucket_name(
-    "GCSFS_HNS_TEST_REQ_PAYS_BUCKET", "gcsfs_hns_test_req_pays"
-)
-TEST_KMS_KEY = os.getenv(
+# All settings are resolved from the environment once, at import time, and
+# exposed through a read-only view so consumers cannot re-evaluate or mutate them.
+_settings = {
+    "TEST_BUCKET": _get_bucket_name("GCSFS_TEST_BUCKET", "gcsfs_test"),
+    "TEST_VERSIONED_BUCKET": _get_bucket_name(
+        "GCSFS_TEST_VERSIONED_BUCKET", "gcsfs_test_versioned"
+    ),
+    "TEST_HNS_BUCKET": _get_bucket_name("GCSFS_HNS_TEST_BUCKET", "gcsfs_hns_test"),
+    "TEST_ZONAL_BUCKET": _get_bucket_name(
+        "GCSFS_ZONAL_TEST_BUCKET", "gcsfs_zonal_test"
+    ),
+    "TEST_PROJECT": os.getenv("GCSFS_TEST_PROJECT", "project"),
+    "TEST_REGION": os.getenv("GCSFS_TEST_REGION", "us-central1"),
+    "TEST_REQUESTER_PAYS_BUCKET": _get_bucket_name(
+        "GCSFS_TEST_REQ_PAYS_BUCKET", "gcsfs_test_req_pays"
+    ),
+    "TEST_HNS_REQUESTER_PAYS_BUCKET": _get_bucket_name(
+        "GCSFS_HNS_TEST_REQ_PAYS_BUCKET", "gcsfs_hns_test_req_pays"
+    ),
+}
+_settings["TEST_KMS_KEY"] = os.getenv(
     "GCSFS_TEST_KMS_KEY",
-    f"projects/{TEST_PROJECT}/locations/{TEST_REGION}/keyRings/gcsfs_test/cryptoKeys/gcsfs_test_key",
+    f"projects/{_settings['TEST_PROJECT']}/locations/{_settings['TEST_REGION']}"
+    "/keyRings/gcsfs_test/cryptoKeys/gcsfs_test_key",
 )
 
 # =============================================================================
 # Performance Benchmark Settings
 # =============================================================================
-BENCHMARK_FILTER = os.environ.get("GCSFS_BENCHMARK_FILTER", "")
-BENCHMARK_CPU_AFFINITY = (
-    os.environ.get("GCSFS_BENCHMARK_CPU_AFFINITY", "false").lower() == "true"
+_settings.update(
+    {
+        "BENCHMARK_FILTER": os.environ.get("GCSFS_BENCHMARK_FILTER", ""),
+        "BENCHMARK_CPU_AFFINITY": (
+            os.environ.get("GCSFS_BENCHMARK_CPU_AFFINITY", "false").lower() == "true"
+        ),
+        # Upload benchmarks send gzip-compressed, highly repetitive payloads instead
+        # of random bytes. This measures client-side overhead rather than network
+        # throughput.
+        "BENCHMARK_COMPRESSED": (
+            os.environ.get("GCSFS_BENCHMARK_COMPRESSED", "false").lower() == "true"
+        ),
+        # Size of the HTTP connection pool used by benchmark filesystems. The
+        # default covers 4 connections per thread for the largest configured
+        # thread count (64).
+        "BENCHMARK_CONNECTION_LIMIT": int(
+            os.environ.get("GCSFS_BENCHMARK_CONNECTION_LIMIT", "256")
+        ),
+    }
 )
+
+SETTINGS = MappingProxyType(_settings)
+
+TEST_BUCKET = SETTINGS["TEST_BUCKET"]
+TEST_VERSIONED_BUCKET = SETTINGS["TEST_VERSIONED_BUCKET"]
+TEST_HNS_BUCKET = SETTINGS["TEST_HNS_BUCKET"]
+TEST_ZONAL_BUCKET = SETTINGS["TEST_ZONAL_BUCKET"]
+TEST_PROJECT = SETTINGS["TEST_PROJECT"]
+TEST_REGION = SETTINGS["TEST_REGION"]
+TEST_REQUESTER_PAYS_BUCKET = SETTINGS["TEST_REQUESTER_PAYS_BUCKET"]
+TEST_HNS_REQUESTER_PAYS_BUCKET = SETTINGS["TEST_HNS_REQUESTER_PAYS_BUCKET"]
+TEST_KMS_KEY = SETTINGS["TEST_KMS_KEY"]
+
+BENCHMARK_FILTER = SETTINGS["BENCHMARK_FILTER"]
+BENCHMARK_CPU_AFFINITY = SETTINGS["BENCHMARK_CPU_AFFINITY"]
+BENCHMARK_COMPRESSED = SETTINGS["BENCHMARK_COMPRESSED"]
+BENCHMARK_CONNECTION_LIMIT = SETTINGS["BENCHMARK_CONNECTION_LIMIT"]
@@ -28,6 +28,7 @@ from gcsfs.tests.conftest import (
     a,
     allfiles,
     b,
+    blocksize_lines,
     csv_files,
     files,
     requires_real_gcs,
@@ -62,6 +63,21 @@ def test_gcs_init_invalid_access():
         assert f"'{scope}'" in msg or f'"{scope}"' in msg
 
 
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("gs://bucket/dir/file", "bucket/dir"),
+        ("bucket/dir/", "bucket/dir"),
+        ("bucket/file", "bucket"),
+        ("bucket", ""),
+    ],
+)
+def test_parent(path, expected):
+    assert GCSFileSystem._parent(path) == expected
+    # A second, memoized lookup must agree with the first.
+    assert GCSFileSystem._parent(path) == expected
+
+
 def test_exists(gcs):
     # Existing file
     fn = TEST_BUCKET + "/nested/file1"
@@ -1627,9 +1643,8 @@ def test_seek_delimiter(gcs):
         assert f.tell() == ind + 1
 
 
-def test_read_block(gcs):
-    data = files["test/accounts.1.json"]
-    lines = io.BytesIO(data).readlines()
+def test_read_block(gcs, json_data, lines):
+    data = json_data
     path = TEST_BUCKET + "/test/accounts.1.json"
     assert gcs.read_block(path, 1, 35, b"\n") == lines[1]
     assert gcs.read_block(path, 0, 30, b"\n") == lines[0]
@@ -1710,13 +1725,13 @@ def test_write_blocks2(gcs):
 
 
 def test_readline(gcs):
-    all_items = chain.from_iterable(
-        [files.items(), csv_files.items(), text_files.items()]
-    )
-    for k, data in all_items:
+    # Loop rather than parametrize: each case would otherwise pay for a full
+    # ``gcs`` fixture setup and teardown (bucket repopulation).
+    for k, data in chain(files.items(), csv_files.items(), text_files.items()):
         with gcs.open("/".join([TEST_BUCKET, k]), "rb") as f:
             result = f.readline()
-            expected = data.split(b"\n")[0] + (b"\n" if data.count(b"\n") else b"")
+            idx = data.find(b"\n")
+            expected = data if idx == -1 else data[: idx + 1]
         assert result == expected
 
 
@@ -1752,21 +1767,12 @@ def test_readline_empty(gcs):
 
 
 def test_readline_blocksize(gcs):
-    data = b"ab\n" + b"a" * (2**18) + b"\nab"
+    data = text_files["zonal/test/c"]
     with gcs.open(a, "wb") as f:
         f.write(data)
     with gcs.open(a, "rb", block_size=2**18) as f:
-        result = f.readline()
-        expected = b"ab\n"
-        assert result == expected
-
-        result = f.readline()
-        expected = b"a" * (2**18) + b"\n"
-        assert result == expected
-
-        result = f.readline()
-        expected = b"ab"
-        assert result == expected
+        for expected in blocksize_lines:
+            assert f.readline() == expected
 
 
 def test_next(gcs):
@@ -2751,6 +2757,26 @@ def test_cat_file_routing_and_thresholds(gcs, monkeypatch):
         ] == [(0, 5), (5, 10), (10, 15), (15, 21)]
 
 
+def test_cat_file_concurrent_negative_offsets(gcs, monkeypatch):
+    monkeypatch.setattr(gcs, "MIN_CHUNK_SIZE_FOR_CONCURRENCY", 5)
+    fn = f"{TEST_BUCKET}/core_negative_offsets.txt"
+    data = b"0123456789abcdefghijk"
+    gcs.pipe(fn, data)
+
+    # Suffix reads are a single "bytes=-N" request, without a size lookup.
+    with mock.patch.object(gcs, "_call", wraps=gcs._call) as mock_call:
+        fsspec.asyn.sync(gcs.loop, gcs._cat_file, fn, start=-16, concurrency=4)
+        assert mock_call.call_count == 1
+        assert mock_call.call_args.kwargs["headers"] == {"Range": "bytes=-16"}
+
+    res = fsspec.asyn.sync(
+        gcs.loop, gcs._cat_file, fn, start=-16, end=-1, concurrency=4
+    )
+    assert res == data[-16:-1]
+    res = fsspec.asyn.sync(gcs.loop, gcs._cat_file, fn, start=2, end=-2, concurrency=4)
+    assert res == data[2:-2]
+
+
 def test_cat_file_concurrent_data_integrity(gcs):
     fn = f"{TEST_BUCKET}/core_integrity.txt"
     file_size = 20 * 1024 * 1024  # 20MB
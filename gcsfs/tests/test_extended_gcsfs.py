@@ -21,6 +21,7 @@ from google.cloud.storage.asyncio.async_multi_range_downloader import (
 from google.cloud.storage.exceptions import DataCorruption
 
 from gcsfs import caching
+from gcsfs.core import GCSFileSystem
 from gcsfs.extended_gcsfs import (
     BucketType,
     ExtendedGcsFileSystem,
@@ -30,16 +31,25 @@ from gcsfs.extended_gcsfs import (
     simple_upload,
     upload_chunk,
 )
-from gcsfs.tests.conftest import csv_files, files, requires_rapid, text_files
+from gcsfs.tests.conftest import (
+    blocksize_lines,
+    csv_files,
+    files,
+    is_real_gcs_bucket,
+    requires_rapid,
+    runs_rapid_tests,
+    text_files,
+)
 from gcsfs.tests.settings import TEST_BUCKET, TEST_ZONAL_BUCKET
-from gcsfs.tests.utils import is_real_gcs, tempdir, tmpfile
-from gcsfs.zb_hns_utils import MRDPool
+from gcsfs.tests.utils import tempdir, tmpfile
+from gcsfs.zb_hns_utils import MRDPool, MRDPoolCache
+
+if not runs_rapid_tests:
+    # Every test here is skipped anyway; stop before building the module data.
+    pytest.skip(requires_rapid.kwargs["reason"], allow_module_level=True)
 
 file = "test/accounts.1.json"
 file_path = f"{TEST_ZONAL_BUCKET}/{file}"
-json_data = files[file]
-lines = io.BytesIO(json_data).readlines()
-file_size = len(json_data)
 
 file2 = "test/accounts.2.json"
 file2_path = f"{TEST_ZONAL_BUCKET}/{file2}"
@@ -52,46 +62,84 @@ c = TEST_ZONAL_BUCKET + "/zonal/test/c"
 pytestmark = [requires_rapid]
 
 
+def _download_side_effect(file_data):
+    """Returns a ``download_ranges`` side effect serving reads from ``file_data``.
+
+    ``BytesIO`` targets are written straight from a memoryview slice, saving
+    an intermediate copy. Other buffers (e.g. ``PartialView``) only accept
+    ``bytes``, like the real downloader writes.
+    """
+    view = memoryview(file_data)
+
+    async def download_side_effect(read_requests, **kwargs):
+        for offset, length, buffer_arg in read_requests:
+            if hasattr(buffer_arg, "write"):
+                chunk = view[offset : offset + length]
+                if not isinstance(buffer_arg, io.BytesIO):
+                    chunk = chunk.tobytes()
+                buffer_arg.write(chunk)
+
+    return download_side_effect
+
+
+@pytest.fixture(scope="module")
+def _bucket_mocks_harness():
+    """Builds the spec'd mocks and their patchers once for the whole module.
+
+    ``gcs_bucket_mocks`` resets and reconfigures them on every use instead of
+    recreating them.
+    """
+    mock_downloader = mock.Mock(spec=AsyncMultiRangeDownloader)
+    mock_downloader.download_ranges = mock.AsyncMock()
+    mock_downloader.close = mock.AsyncMock()
+    mock_pool = mock.AsyncMock(spec=MRDPool)
+    mocks = {
+        "sync_lookup_bucket_type": mock.Mock(),
+        "lookup_bucket_type": mock.AsyncMock(),
+        "create_mrd": mock.AsyncMock(),
+        "downloader": mock_downloader,
+        "cat_file": mock.AsyncMock(),
+        "pool_cache_get": mock.AsyncMock(),
+        "pool": mock_pool,
+    }
+    patchers = [
+        mock.patch.multiple(
+            ExtendedGcsFileSystem,
+            _sync_lookup_bucket_type=mocks["sync_lookup_bucket_type"],
+            _lookup_bucket_type=mocks["lookup_bucket_type"],
+        ),
+        mock.patch.object(AsyncMultiRangeDownloader, "create_mrd", mocks["create_mrd"]),
+        mock.patch.object(GCSFileSystem, "_cat_file", mocks["cat_file"]),
+        mock.patch.object(MRDPoolCache, "get", mocks["pool_cache_get"]),
+    ]
+    return mocks, patchers
+
+
 @pytest.fixture
-def gcs_bucket_mocks():
+def gcs_bucket_mocks(_bucket_mocks_harness):
     """A factory fixture for mocking bucket functionality for different bucket types."""
+    mocks, patchers = _bucket_mocks_harness
 
     @contextlib.contextmanager
     def _gcs_bucket_mocks_factory(file_data, bucket_type_val):
-        """Creates mocks for a given file content and bucket type."""
-        if is_real_gcs():
+        """Configures the shared mocks for a given file content and bucket type."""
+        if is_real_gcs_bucket:
             yield None
             return
-        patch_target_lookup_bucket_type = (
-            "gcsfs.extended_gcsfs.ExtendedGcsFileSystem._lookup_bucket_type"
-        )
-        patch_target_sync_lookup_bucket_type = (
-            "gcsfs.extended_gcsfs.ExtendedGcsFileSystem._sync_lookup_bucket_type"
-        )
-        patch_target_create_mrd = (
-            "google.cloud.storage.asyncio.async_multi_range_downloader"
-            ".AsyncMultiRangeDownloader.create_mrd"
-        )
-        patch_target_gcsfs_cat_file = "gcsfs.core.GCSFileSystem._cat_file"
-
-        async def download_side_effect(read_requests, **kwargs):
-            for param_offset, param_length, buffer_arg in read_requests:
-                if hasattr(buffer_arg, "write"):
-                    buffer_arg.write(
-                        file_data[param_offset : param_offset + param_length]
-                    )
-
-        mock_downloader = mock.Mock(spec=AsyncMultiRangeDownloader)
-        mock_downloader.download_ranges = mock.AsyncMock(
-            side_effect=download_side_effect
-        )
+
+        for m in mocks.values():
+            m.reset_mock(return_value=True, side_effect=True)
+
+        mock_downloader = mocks["downloader"]
+        mock_downloader.download_ranges.side_effect = _download_side_effect(file_data)
+        mock_downloader.is_stream_open = True
         mock_downloader.persisted_size = None
         mock_downloader.bucket_name = "mock_bucket"
         mock_downloader.object_name = "mock_object"
 
-        mock_create_mrd = mock.AsyncMock(return_value=mock_downloader)
+        mocks["create_mrd"].return_value = mock_downloader
 
-        mock_pool = mock.AsyncMock(spec=MRDPool)
+        mock_pool = mocks["pool"]
         mock_pool.persisted_size = len(file_data)
         mock_pool.get_mrd.return_value.__aenter__.return_value = mock_downloader
 
@@ -100,60 +148,21 @@ def gcs_bucket_mocks():
 
         mock_pool.close.side_effect = close_pool
 
-        with (
-            mock.patch(
-                patch_target_sync_lookup_bucket_type, return_value=bucket_type_val
-            ) as mock_sync_lookup_bucket_type,
-            mock.patch(
-                patch_target_lookup_bucket_type,
-                return_value=bucket_type_val,
-            ),
-            mock.patch(patch_target_create_mrd, mock_create_mrd),
-            mock.patch(
-                patch_target_gcsfs_cat_file, new_callable=mock.AsyncMock
-            ) as mock_cat_file,
-            mock.patch(
-                "gcsfs.zb_hns_utils.MRDPoolCache.get", new_callable=mock.AsyncMock
-            ) as mock_pool_cache_get,
-        ):
-            mock_pool_cache_get.return_value = mock_pool
-
-            mocks = {
-                "sync_lookup_bucket_type": mock_sync_lookup_bucket_type,
-                "create_mrd": mock_create_mrd,
-                "downloader": mock_downloader,
-                "cat_file": mock_cat_file,
-                "pool_cache_get": mock_pool_cache_get,
-                "pool": mock_pool,
-            }
+        mocks["sync_lookup_bucket_type"].return_value = bucket_type_val
+        mocks["lookup_bucket_type"].return_value = bucket_type_val
+        mocks["pool_cache_get"].return_value = mock_pool
+
+        with contextlib.ExitStack() as stack:
+            for patcher in patchers:
+                stack.enter_context(patcher)
             yield mocks
             # Common assertion for all tests using this mock
-            mock_cat_file.assert_not_called()
+            assert mocks["cat_file"].call_count == 0, "cat_file should not be called"
 
     return _gcs_bucket_mocks_factory
 
 
-read_block_params = [
-    # Read specific chunk
-    pytest.param(3, 10, None, json_data[3 : 3 + 10], id="offset=3, length=10"),
-    # Read from beginning up to length
-    pytest.param(0, 5, None, json_data[0:5], id="offset=0, length=5"),
-    # Read from offset to end (simulate large length)
-    pytest.param(15, 5000, None, json_data[15:], id="offset=15, length=large"),
-    # Read beyond end of file (should return empty bytes)
-    pytest.param(file_size + 10, 5, None, b"", id="offset>size, length=5"),
-    # Read exactly at the end (zero length)
-    pytest.param(file_size, 10, None, b"", id="offset=size, length=10"),
-    # Read with delimiter
-    pytest.param(1, 35, b"\n", lines[1], id="offset=1, length=35, delimiter=newline"),
-    pytest.param(0, 30, b"\n", lines[0], id="offset=0, length=35, delimiter=newline"),
-    pytest.param(
-        0, 35, b"\n", lines[0] + lines[1], id="offset=0, length=35, delimiter=newline"
-    ),
-]
-
-
-def test_read_small_zb(extended_gcsfs, gcs_bucket_mocks):
+def test_read_full_zb(extended_gcsfs, gcs_bucket_mocks):
     csv_file = "2014-01-01.csv"
     csv_file_path = f"{TEST_ZONAL_BUCKET}/{csv_file}"
     csv_data = csv_files[csv_file]
@@ -161,36 +170,45 @@ def test_read_small_zb(extended_gcsfs, gcs_bucket_mocks):
     with gcs_bucket_mocks(
         csv_data, bucket_type_val=BucketType.ZONAL_HIERARCHICAL
     ) as mocks:
-        with extended_gcsfs.open(
-            csv_file_path, "rb", block_size=10, cache_type="readahead_chunked"
-        ) as f:
-            out = []
-            i = 1
-            while True:
-                i += 1
-                data = f.read(3)
-                if data == b"":
-                    break
-                out.append(data)
-            assert extended_gcsfs.cat(csv_file_path) == b"".join(out)
-            # cache drop
-            assert len(f.cache.cache) < len(out)
+        with extended_gcsfs.open(csv_file_path, "rb") as f:
+            assert f.read() == csv_data
             if mocks:
                 mocks["sync_lookup_bucket_type"].assert_called_once_with(
                     TEST_ZONAL_BUCKET
                 )
 
 
-def test_readline_zb(extended_gcsfs, gcs_bucket_mocks):
-    all_items = chain.from_iterable(
-        [files.items(), csv_files.items(), text_files.items()]
-    )
-    for k, data in all_items:
-        with gcs_bucket_mocks(data, bucket_type_val=BucketType.ZONAL_HIERARCHICAL):
-            with extended_gcsfs.open("/".join([TEST_ZONAL_BUCKET, k]), "rb") as f:
-                result = f.readline()
-                expected = data.split(b"\n")[0] + (b"\n" if data.count(b"\n") else b"")
-            assert result == expected
+def test_read_small_cache_drop_zb(extended_gcsfs, gcs_bucket_mocks):
+    csv_file = "2014-01-01.csv"
+    csv_file_path = f"{TEST_ZONAL_BUCKET}/{csv_file}"
+    csv_data = csv_files[csv_file]
+    n_reads = 6
+
+    with gcs_bucket_mocks(csv_data, bucket_type_val=BucketType.ZONAL_HIERARCHICAL):
+        with extended_gcsfs.open(
+            csv_file_path, "rb", block_size=10, cache_type="readahead_chunked"
+        ) as f:
+            out = [f.read(3) for _ in range(n_reads)]
+            assert b"".join(out) == csv_data[: 3 * n_reads]
+            # cache drop: earlier blocks are evicted, so fewer bytes are held
+            # than were read
+            assert len(f.cache.cache) < 3 * n_reads
+
+
+all_items = [
+    (k, data, f"{TEST_ZONAL_BUCKET}/{k}")
+    for k, data in chain(files.items(), csv_files.items(), text_files.items())
+]
+
+
+@pytest.mark.parametrize("k, data, path", all_items, ids=[k for k, _, _ in all_items])
+def test_readline_zb(extended_gcsfs, gcs_bucket_mocks, k, data, path):
+    with gcs_bucket_mocks(data, bucket_type_val=BucketType.ZONAL_HIERARCHICAL):
+        with extended_gcsfs.open(path, "rb") as f:
+            result = f.readline()
+            idx = data.find(b"\n")
+            expected = data if idx == -1 else data[: idx + 1]
+        assert result == expected
 
 
 def test_readline_from_cache_zb(extended_gcsfs, gcs_bucket_mocks):
@@ -225,17 +243,8 @@ def test_readline_blocksize_zb(extended_gcsfs, gcs_bucket_mocks):
     data = text_files["zonal/test/c"]
     with gcs_bucket_mocks(data, bucket_type_val=BucketType.ZONAL_HIERARCHICAL):
         with extended_gcsfs.open(c, "rb", block_size=2**18) as f:
-            result = f.readline()
-            expected = b"ab\n"
-            assert result == expected
-
-            result = f.readline()
-            expected = b"a" * (2**18) + b"\n"
-            assert result == expected
-
-            result = f.readline()
-            expected = b"ab"
-            assert result == expected
+            for expected in blocksize_lines:
+                assert f.readline() == expected
 
 
 def test_read_unfinalized_file_using_mrd(extended_gcsfs, file_path):
@@ -803,12 +812,15 @@ async def test_initiate_upload_zonal(async_gcs, zonal_write_mocks, file_path):
         await writer.close()
 
 
+# Deterministic 1KB payload; the object path is already unique per test.
+_UPLOAD_CHUNK_DATA = bytes(range(256)) * 4
+
+
 @pytest.mark.asyncio
 async def test_initiate_and_upload_chunk_zonal(async_gcs, zonal_write_mocks, file_path):
     """Test upload_chunk for Zonal buckets appends data."""
-    size_in_bytes = 1024  # 1KB
-    data1 = os.urandom(size_in_bytes - 1)
-    data2 = os.urandom(size_in_bytes)
+    data1 = _UPLOAD_CHUNK_DATA[:-1]
+    data2 = _UPLOAD_CHUNK_DATA
     bucket, object_name, _ = async_gcs.split_path(file_path)
     writer = await initiate_upload(fs=async_gcs, bucket=bucket, key=object_name)
     await upload_chunk(
@@ -932,12 +944,27 @@ async def test_pipe_file_zonal(async_gcs, zonal_write_mocks, file_path):
             grpc_client, bucket, object_name
         )
         zonal_write_mocks["aaow"].append.assert_awaited_once_with(data)
+        # A single-chunk payload is handed over as-is, not as a memoryview copy
+        assert zonal_write_mocks["aaow"].append.await_args.args[0] is data
         zonal_write_mocks["aaow"].close.assert_awaited_once_with(finalize_on_close=True)
     else:
         assert await async_gcs._cat(file_path) == data
 
 
-def test_get_file_from_zonal_bucket(extended_gcsfs, gcs_bucket_mocks):
+@pytest.mark.asyncio
+async def test_pipe_file_zonal_multiple_chunks(async_gcs, zonal_write_mocks, file_path):
+    """Test _pipe_file for Zonal buckets appends data larger than chunksize in chunks."""
+    data = b"0123456789"
+    await async_gcs._pipe_file(file_path, data, chunksize=4, finalize_on_close=True)
+
+    if zonal_write_mocks:
+        appended = [c.args[0] for c in zonal_write_mocks["aaow"].append.await_args_list]
+        assert appended == [b"0123", b"4567", b"89"]
+    else:
+        assert await async_gcs._cat(file_path) == data
+
+
+def test_get_file_from_zonal_bucket(extended_gcsfs, gcs_bucket_mocks, json_data):
     """Test getting a file from a Zonal bucket with mocks."""
     with gcs_bucket_mocks(
         json_data, bucket_type_val=BucketType.ZONAL_HIERARCHICAL
@@ -957,13 +984,10 @@ async def create_mrd_side_effect(client, bucket, object_name, generation):
     """Side effect function to create a mocked AsyncMultiRangeDownloader."""
     file_data = files[object_name]
 
-    async def download_side_effect(read_requests, **kwargs):
-        for param_offset, param_length, buffer_arg in read_requests:
-            if hasattr(buffer_arg, "write"):
-                buffer_arg.write(file_data[param_offset : param_offset + param_length])
-
     downloader = mock.Mock(spec=AsyncMultiRangeDownloader)
-    downloader.download_ranges = mock.AsyncMock(side_effect=download_side_effect)
+    downloader.download_ranges = mock.AsyncMock(
+        side_effect=_download_side_effect(file_data)
+    )
     downloader.persisted_size = len(file_data)
     downloader.close = mock.AsyncMock()
     downloader.bucket_name = "bucket"
@@ -1085,7 +1109,7 @@ async def test_cp_file_not_implemented_error(
     dest_path = f"{dest_bucket}/dest_{short_uuid}"
 
     # Source file needs to exist for last case when super method is called for standard buckets
-    if is_real_gcs():
+    if is_real_gcs_bucket:
         await async_gcs._pipe_file(source_path, b"test data", finalize_on_close=True)
 
     async def mock_is_zonal(bucket):
@@ -1093,7 +1117,7 @@ async def test_cp_file_not_implemented_error(
 
     is_zonal_patch_cm = (
         mock.patch.object(async_gcs, "_is_zonal_bucket", side_effect=mock_is_zonal)
-        if not is_real_gcs()
+        if not is_real_gcs_bucket
         else contextlib.nullcontext()
     )
 
@@ -1108,7 +1132,7 @@ async def test_cp_file_not_implemented_error(
             ):
                 await async_gcs._cp_file(source_path, dest_path)
         else:  # Standard -> Standard
-            if is_real_gcs():
+            if is_real_gcs_bucket:
                 await async_gcs._cp_file(source_path, dest_path)
                 assert await async_gcs._cat(dest_path) == b"test data"
             else:
@@ -1119,53 +1143,110 @@ async def test_cp_file_not_implemented_error(
                     mock_super_cp.assert_awaited_once()
 
 
-def test_read_block_zb(extended_gcsfs, gcs_bucket_mocks, subtests):
-    for param in read_block_params:
-        with subtests.test(id=param.id):
-            offset, length, delimiter, expected_data = param.values
-            path = file_path
+def test_read_block_zb(
+    extended_gcsfs, gcs_bucket_mocks, json_data, read_block_params, subtests
+):
+    path = file_path
+
+    # json_data is the same for every case, so one mock scope serves them all.
+    with gcs_bucket_mocks(
+        json_data, bucket_type_val=BucketType.ZONAL_HIERARCHICAL
+    ) as mocks:
+        for case_id, case in read_block_params.items():
+            offset, length, delimiter, expected_data = case
+            with subtests.test(msg=case_id):
+                if mocks:
+                    mocks["sync_lookup_bucket_type"].reset_mock()
+                    mocks["downloader"].download_ranges.reset_mock()
 
-            with gcs_bucket_mocks(
-                json_data, bucket_type_val=BucketType.ZONAL_HIERARCHICAL
-            ) as mocks:
                 result = extended_gcsfs.read_block(path, offset, length, delimiter)
 
                 assert result == expected_data
 
-                if mocks:
-                    mocks["sync_lookup_bucket_type"].assert_called_once_with(
-                        TEST_ZONAL_BUCKET
-                    )
-
-                    if expected_data:
-                        call_args_list = mocks[
-                            "downloader"
-                        ].download_ranges.await_args_list
-                        assert call_args_list, "download_ranges was not called"
-
-                        # Aggregate all the ranges passed across concurrent calls
-                        actual_ranges = []
-                        for call in call_args_list:
-                            actual_ranges.extend(call[0][0])
-
-                        if delimiter:
-                            # fsspec dynamically calculates read block offsets when hunting
-                            # for delimiters. We just assert that it requested ranges.
-                            assert len(actual_ranges) >= 1
-                        else:
-                            assert len(actual_ranges) >= 1
-                            actual_offsets = sorted(
-                                range_[0] for range_ in actual_ranges
-                            )
-                            expected_offsets = [offset]
-                            if len(actual_ranges) == 2:
-                                expected_offsets.append(offset + length)
-                            assert actual_offsets == expected_offsets
+                if not mocks:
+                    continue
+
+                mocks["sync_lookup_bucket_type"].assert_called_once_with(
+                    TEST_ZONAL_BUCKET
+                )
+
+                if expected_data:
+                    call_args_list = mocks["downloader"].download_ranges.await_args_list
+                    assert call_args_list, "download_ranges was not called"
+
+                    # Aggregate all the ranges passed across concurrent calls
+                    actual_ranges = []
+                    for call in call_args_list:
+                        actual_ranges.extend(call[0][0])
+
+                    if delimiter:
+                        # fsspec dynamically calculates read block offsets when hunting
+                        # for delimiters. We just assert that it requested ranges.
+                        assert len(actual_ranges) >= 1
                     else:
-                        mocks["downloader"].download_ranges.assert_not_called()
+                        assert len(actual_ranges) >= 1
+                        actual_offsets = sorted(range_[0] for range_ in actual_ranges)
+                        expected_offsets = [offset]
+                        if len(actual_ranges) == 2:
+                            expected_offsets.append(offset + length)
+                        assert actual_offsets == expected_offsets
+                else:
+                    mocks["downloader"].download_ranges.assert_not_called()
+
+
+def test_cat_ranges_zb(extended_gcsfs, gcs_bucket_mocks):
+    csv_file = "2014-01-01.csv"
+    csv_file_path = f"{TEST_ZONAL_BUCKET}/{csv_file}"
+    csv_data = csv_files[csv_file]
+    starts = [0, 5, 20, 30]
+    ends = [10, 15, 25, 30]
+
+    with gcs_bucket_mocks(
+        csv_data, bucket_type_val=BucketType.ZONAL_HIERARCHICAL
+    ) as mocks:
+        result = extended_gcsfs.cat_ranges([csv_file_path] * 4, starts, ends)
+
+        assert result == [csv_data[s:e] for s, e in zip(starts, ends)]
+        if mocks:
+            # All ranges of the file share one pool and one download_ranges
+            # call, with the overlapping ranges coalesced into a single span
+            mocks["pool_cache_get"].assert_awaited_once()
+            mocks["downloader"].download_ranges.assert_awaited_once()
+            requested = mocks["downloader"].download_ranges.await_args.args[0]
+            assert [(o, n) for o, n, _ in requested] == [(0, 15), (20, 5)]
 
 
-def test_mrd_stream_cleanup(extended_gcsfs, gcs_bucket_mocks):
+def test_cat_ranges_zb_splits_large_ranges(
+    extended_gcsfs, gcs_bucket_mocks, monkeypatch
+):
+    csv_file = "2014-01-01.csv"
+    csv_file_path = f"{TEST_ZONAL_BUCKET}/{csv_file}"
+    csv_data = csv_files[csv_file]
+    monkeypatch.setattr(extended_gcsfs, "MIN_CHUNK_SIZE_FOR_CONCURRENCY", 10)
+    starts = [0, 5]
+    ends = [5, 45]
+
+    with gcs_bucket_mocks(
+        csv_data, bucket_type_val=BucketType.ZONAL_HIERARCHICAL
+    ) as mocks:
+        result = extended_gcsfs.cat_ranges(
+            [csv_file_path] * 2, starts, ends, concurrency=4
+        )
+
+        assert result == [csv_data[s:e] for s, e in zip(starts, ends)]
+        if mocks:
+            # The small range is batched on its own, while the large one is
+            # split across a pool sized to the requested concurrency
+            assert mocks["pool_cache_get"].await_args.kwargs["pool_size"] == 4
+            requested = sorted(
+                (o, n)
+                for call in mocks["downloader"].download_ranges.await_args_list
+                for o, n, _ in call.args[0]
+            )
+            assert requested == [(0, 5), (5, 10), (15, 10), (25, 10), (35, 10)]
+
+
+def test_mrd_stream_cleanup(extended_gcsfs, gcs_bucket_mocks, json_data):
     """
     Tests that mrd stream is properly closed during file lifecycle.
     """
@@ -1340,9 +1421,15 @@ async def test_fetch_range_split_out_of_bounds(extended_gcsfs):
 async def test_fetch_range_split_concurrent_success(extended_gcsfs):
     """Tests MRDPool creation, cleanup, and concurrent _cat_file dispatching."""
     mock_pool = mock.AsyncMock()
-    extended_gcsfs._mrd_pool_cache.get = mock.AsyncMock(return_value=mock_pool)
 
     with contextlib.ExitStack() as stack:
+        stack.enter_context(
+            mock.patch.object(
+                extended_gcsfs._mrd_pool_cache,
+                "get",
+                mock.AsyncMock(return_value=mock_pool),
+            )
+        )
         stack.enter_context(
             mock.patch.object(extended_gcsfs, "_is_zonal_bucket", return_value=True)
         )
@@ -1383,9 +1470,15 @@ async def test_fetch_range_split_concurrent_success(extended_gcsfs):
 async def test_fetch_range_split_concurrent_exception(extended_gcsfs):
     """Tests that exceptions in the concurrent tasks bubble up correctly."""
     mock_pool = mock.AsyncMock()
-    extended_gcsfs._mrd_pool_cache.get = mock.AsyncMock(return_value=mock_pool)
 
     with contextlib.ExitStack() as stack:
+        stack.enter_context(
+            mock.patch.object(
+                extended_gcsfs._mrd_pool_cache,
+                "get",
+                mock.AsyncMock(return_value=mock_pool),
+            )
+        )
         stack.enter_context(
             mock.patch.object(extended_gcsfs, "_is_zonal_bucket", return_value=True)
         )
@@ -1413,9 +1506,15 @@ async def test_fetch_range_split_concurrent_exception(extended_gcsfs):
 async def test_cat_file_zero_length_read(extended_gcsfs):
     """Tests that _cat_file returns empty bytes and cleans up if length resolves to 0."""
     mock_pool = mock.AsyncMock()
-    extended_gcsfs._mrd_pool_cache.get = mock.AsyncMock(return_value=mock_pool)
 
     with contextlib.ExitStack() as stack:
+        stack.enter_context(
+            mock.patch.object(
+                extended_gcsfs._mrd_pool_cache,
+                "get",
+                mock.AsyncMock(return_value=mock_pool),
+            )
+        )
         stack.enter_context(
             mock.patch.object(extended_gcsfs, "_is_zonal_bucket", return_value=True)
         )
@@ -1454,9 +1553,15 @@ async def test_cat_file_delegates_resolved_range_to_mrd_fetch(
     """Tests that _cat_file delegates the resolved range to the concurrent fetcher."""
     monkeypatch.setattr(extended_gcsfs, "MIN_CHUNK_SIZE_FOR_CONCURRENCY", 1000)
     mock_pool = mock.AsyncMock()
-    extended_gcsfs._mrd_pool_cache.get = mock.AsyncMock(return_value=mock_pool)
 
     with contextlib.ExitStack() as stack:
+        stack.enter_context(
+            mock.patch.object(
+                extended_gcsfs._mrd_pool_cache,
+                "get",
+                mock.AsyncMock(return_value=mock_pool),
+            )
+        )
         stack.enter_context(
             mock.patch.object(extended_gcsfs, "_is_zonal_bucket", return_value=True)
         )
@@ -2,6 +2,7 @@
 import asyncio
 import io
 import logging
+import re
 from unittest import mock
 
 import aiohttp
@@ -21,7 +22,10 @@ from gcsfs.extended_gcsfs import (
 )
 from gcsfs.tests.conftest import csv_files, files, requires_rapid
 from gcsfs.tests.settings import TEST_BUCKET, TEST_ZONAL_BUCKET
-from gcsfs.tests.test_extended_gcsfs import gcs_bucket_mocks  # noqa: F401
+from gcsfs.tests.test_extended_gcsfs import (  # noqa: F401
+    _bucket_mocks_harness,
+    gcs_bucket_mocks,
+)
 from gcsfs.tests.utils import is_real_gcs, tmpfile
 from gcsfs.zb_hns_utils import MRDPoolCache
 
@@ -35,6 +39,8 @@ a = TEST_ZONAL_BUCKET + "/zonal/test/a"
 b = TEST_ZONAL_BUCKET + "/zonal/test/b"
 c = TEST_ZONAL_BUCKET + "/zonal/test/c"
 
+TEST_EXCEPTION_RE = re.compile("Test exception raised")
+
 pytestmark = [
     requires_rapid,
     pytest.mark.skipif(
@@ -60,16 +66,19 @@ def test_open_uses_default_blocksize_and_consistency_from_fs(
 
 @pytest.mark.parametrize("bucket_type_val", list(BucketType))
 def test_open_uses_correct_blocksize_and_consistency_for_all_bucket_types(
-    extended_gcs_factory, gcs_bucket_mocks, bucket_type_val
+    extended_gcsfs, gcs_bucket_mocks, bucket_type_val, monkeypatch
 ):
     csv_file = "2014-01-01.csv"
     csv_file_path = f"{TEST_ZONAL_BUCKET}/{csv_file}"
     csv_data = csv_files[csv_file]
 
+    # Reconfigure the shared filesystem rather than building a new one per
+    # bucket type; open() only reads these attributes.
     custom_filesystem_block_size = 100 * 1024 * 1024
-    extended_gcsfs = extended_gcs_factory(
-        block_size=custom_filesystem_block_size, consistency="md5"
+    monkeypatch.setattr(
+        extended_gcsfs, "default_block_size", custom_filesystem_block_size
     )
+    monkeypatch.setattr(extended_gcsfs, "consistency", "md5")
 
     with gcs_bucket_mocks(csv_data, bucket_type_val=bucket_type_val):
         with extended_gcsfs.open(csv_file_path, "rb") as f:
@@ -168,32 +177,32 @@ def test_process_limits_when_file_size_passed(extended_gcsfs):
         mock_info.assert_not_called()
 
 
-@pytest.mark.parametrize(
-    "exception_to_raise",
-    [ValueError, DataCorruption, Exception],
-)
-def test_mrd_exception_handling(extended_gcsfs, gcs_bucket_mocks, exception_to_raise):
+def test_mrd_exception_handling(extended_gcsfs, gcs_bucket_mocks, subtests):
     """
     Tests that _cat_file correctly propagates exceptions from mrd.download_ranges.
     """
     with gcs_bucket_mocks(
         json_data, bucket_type_val=BucketType.ZONAL_HIERARCHICAL
     ) as mocks:
-        # Configure the mock to raise a specified exception
-        if exception_to_raise is DataCorruption:
-            # The first argument is 'response', the message is in '*args'
-            mocks["downloader"].download_ranges.side_effect = exception_to_raise(
-                None, "Test exception raised"
-            )
-        else:
-            mocks["downloader"].download_ranges.side_effect = exception_to_raise(
-                "Test exception raised"
-            )
-
-        with pytest.raises(exception_to_raise, match="Test exception raised"):
-            extended_gcsfs.read_block(file_path, 0, 10)
-
-        mocks["downloader"].download_ranges.call_count = 2
+        download_ranges = mocks["downloader"].download_ranges
+        for exception_to_raise in (ValueError, DataCorruption, Exception):
+            with subtests.test(exception=exception_to_raise.__name__):
+                download_ranges.reset_mock()
+                # Configure the mock to raise the exception under test
+                if exception_to_raise is DataCorruption:
+                    # The first argument is 'response', the message is in '*args'
+                    download_ranges.side_effect = exception_to_raise(
+                        None, "Test exception raised"
+                    )
+                else:
+                    download_ranges.side_effect = exception_to_raise(
+                        "Test exception raised"
+                    )
+
+                with pytest.raises(exception_to_raise, match=TEST_EXCEPTION_RE):
+                    extended_gcsfs.read_block(file_path, 0, 10)
+
+                download_ranges.assert_awaited_once()
 
 
 def test_mrd_created_once_for_zonal_file(extended_gcsfs, gcs_bucket_mocks):
@@ -255,32 +264,7 @@ async def test_cat_file_warning_on_missing_persisted_size(
             assert result == json_data[:10]
 
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "unsupported_kwarg",
-    [
-        {"metadatain": {"key": "value"}},
-        {"fixed_key_metadata": {"key": "value"}},
-        {"kms_key_name": "key_name"},
-        {"consistency": "md5"},
-        {"content_type": "text/plain"},
-    ],
-)
-async def test_simple_upload_zonal_unsupported_params(
-    async_gcs, zonal_write_mocks, unsupported_kwarg, caplog, file_path
-):
-    """Test simple_upload for Zonal buckets warns on unsupported parameters."""
-    bucket, object_name, _ = async_gcs.split_path(file_path)
-    # Ensure caplog captures the warning by setting the level
-    with caplog.at_level(logging.WARNING, logger="gcsfs"):
-        await simple_upload(
-            async_gcs,
-            bucket=bucket,
-            key=object_name,
-            datain=b"",
-            **unsupported_kwarg,
-        )
-
+def _assert_ignored_warning(caplog):
     assert any(
         "will be ignored" in r.message and r.levelname == "WARNING"
         for r in caplog.records
@@ -288,31 +272,56 @@ async def test_simple_upload_zonal_unsupported_params(
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "unsupported_kwarg",
-    [
-        {"metadata": {"key": "value"}},
+async def test_simple_upload_zonal_unsupported_params(
+    async_gcs, zonal_write_mocks, caplog, file_path, subtests
+):
+    """Test simple_upload for Zonal buckets warns on unsupported parameters."""
+    bucket, object_name, _ = async_gcs.split_path(file_path)
+    unsupported_kwargs = [
+        {"metadatain": {"key": "value"}},
         {"fixed_key_metadata": {"key": "value"}},
         {"kms_key_name": "key_name"},
+        {"consistency": "md5"},
         {"content_type": "text/plain"},
-    ],
-)
+    ]
+    for unsupported_kwarg in unsupported_kwargs:
+        with subtests.test(kwarg=next(iter(unsupported_kwarg))):
+            caplog.clear()
+            # Ensure caplog captures the warning by setting the level
+            with caplog.at_level(logging.WARNING, logger="gcsfs"):
+                await simple_upload(
+                    async_gcs,
+                    bucket=bucket,
+                    key=object_name,
+                    datain=b"",
+                    **unsupported_kwarg,
+                )
+            _assert_ignored_warning(caplog)
+
+
+@pytest.mark.asyncio
 async def test_initiate_upload_zonal_unsupported_params(
-    async_gcs, zonal_write_mocks, unsupported_kwarg, caplog, file_path
+    async_gcs, zonal_write_mocks, caplog, file_path, subtests
 ):
     """Test initiate_upload for Zonal buckets warns on unsupported parameters."""
     bucket, object_name, _ = async_gcs.split_path(file_path)
-    with caplog.at_level(logging.WARNING, logger="gcsfs"):
-        await initiate_upload(
-            fs=async_gcs,
-            bucket=bucket,
-            key=object_name,
-            **unsupported_kwarg,
-        )
-    assert any(
-        "will be ignored" in r.message and r.levelname == "WARNING"
-        for r in caplog.records
-    )
+    unsupported_kwargs = [
+        {"metadata": {"key": "value"}},
+        {"fixed_key_metadata": {"key": "value"}},
+        {"kms_key_name": "key_name"},
+        {"content_type": "text/plain"},
+    ]
+    for unsupported_kwarg in unsupported_kwargs:
+        with subtests.test(kwarg=next(iter(unsupported_kwarg))):
+            caplog.clear()
+            with caplog.at_level(logging.WARNING, logger="gcsfs"):
+                await initiate_upload(
+                    fs=async_gcs,
+                    bucket=bucket,
+                    key=object_name,
+                    **unsupported_kwarg,
+                )
+            _assert_ignored_warning(caplog)
 
 
 @pytest.mark.asyncio
@@ -951,3 +960,115 @@ async def test_close_resources_with_exceptions(caplog):
 
     assert fs._grpc_client is None
     assert fs._storage_control_client is None
+
+
+@pytest.mark.asyncio
+async def test_exists_many():
+    """Tests that _exists_many maps FileNotFoundError to False and re-raises other errors."""
+    fs = ExtendedGcsFileSystem(token="anon")
+
+    async def fake_info(path, **kwargs):
+        if path == "bucket/missing":
+            raise FileNotFoundError(path)
+        if path == "bucket/broken":
+            raise PermissionError(path)
+        return {"name": path}
+
+    with mock.patch.object(fs, "_info", side_effect=fake_info) as mock_info:
+        assert await fs._exists_many(["bucket/a", "bucket/missing", "bucket/b"]) == [
+            True,
+            False,
+            True,
+        ]
+        assert mock_info.await_count == 3
+
+        with pytest.raises(PermissionError):
+            await fs._exists_many(["bucket/a", "bucket/broken"])
+
+
+@pytest.mark.asyncio
+async def test_cat_ranges_groups_zonal_paths():
+    """Tests that _cat_ranges batches Zonal ranges per file, delegates the rest to
+    GCSFileSystem, and puts every result back in its original position."""
+    fs = ExtendedGcsFileSystem(token="anon")
+
+    async def fake_is_zonal(bucket):
+        return bucket == "zb"
+
+    async def fake_cat_zonal_ranges(path, starts, ends, **kwargs):
+        if path == "zb/missing":
+            raise FileNotFoundError(path)
+        return [f"{path}[{s}:{e}]".encode() for s, e in zip(starts, ends)]
+
+    paths = ["zb/a", "std/x", "zb/b", "zb/a", "zb/missing"]
+    with (
+        mock.patch.object(fs, "_is_zonal_bucket", side_effect=fake_is_zonal),
+        mock.patch.object(
+            fs, "_cat_zonal_ranges", side_effect=fake_cat_zonal_ranges
+        ) as mock_zonal,
+        mock.patch(
+            "gcsfs.core.GCSFileSystem._cat_ranges",
+            new_callable=mock.AsyncMock,
+            return_value=[b"std"],
+        ) as mock_std,
+    ):
+        out = await fs._cat_ranges(paths, [0, 1, 2, 3, 4], [5, 6, 7, 8, 9])
+
+        assert out[:4] == [b"zb/a[0:5]", b"std", b"zb/b[2:7]", b"zb/a[3:8]"]
+        assert isinstance(out[4], FileNotFoundError)
+        mock_zonal.assert_any_await("zb/a", [0, 3], [5, 8])
+        assert mock_zonal.await_count == 3
+        mock_std.assert_awaited_once_with(["std/x"], [1], [6], batch_size=None)
+
+        with pytest.raises(FileNotFoundError):
+            await fs._cat_ranges(paths, 0, 5, on_error="raise")
+
+
+@pytest.mark.asyncio
+async def test_cat_ranges_passes_kwargs_to_zonal_and_other_paths():
+    """Tests that _cat_ranges forwards extra kwargs such as concurrency to both
+    the Zonal per-file reads and the parent implementation."""
+    fs = ExtendedGcsFileSystem(token="anon")
+
+    async def fake_is_zonal(bucket):
+        return bucket == "zb"
+
+    with (
+        mock.patch.object(fs, "_is_zonal_bucket", side_effect=fake_is_zonal),
+        mock.patch.object(
+            fs, "_cat_zonal_ranges", new_callable=mock.AsyncMock, return_value=[b"zb"]
+        ) as mock_zonal,
+        mock.patch(
+            "gcsfs.core.GCSFileSystem._cat_ranges",
+            new_callable=mock.AsyncMock,
+            return_value=[b"std"],
+        ) as mock_std,
+    ):
+        out = await fs._cat_ranges(["zb/a", "std/x"], 0, 5, concurrency=4)
+
+        assert out == [b"zb", b"std"]
+        mock_zonal.assert_awaited_once_with("zb/a", [0], [5], concurrency=4)
+        mock_std.assert_awaited_once_with(
+            ["std/x"], [0], [5], batch_size=None, concurrency=4
+        )
+
+
+@pytest.mark.asyncio
+async def test_cat_ranges_warning_on_missing_persisted_size(
+    extended_gcsfs, gcs_bucket_mocks, caplog
+):
+    """
+    Tests that a warning is logged in cat_ranges when MRD has no 'persisted_size' attribute.
+    """
+    with gcs_bucket_mocks(json_data, bucket_type_val=BucketType.ZONAL_HIERARCHICAL):
+        # 'persisted_size' is set to None in the mock downloader
+        with (
+            caplog.at_level(logging.WARNING, logger="gcsfs"),
+            mock.patch.object(
+                extended_gcsfs, "_info", new_callable=mock.AsyncMock
+            ) as mock_info,
+        ):
+            mock_info.return_value = {"size": len(json_data)}
+            result = await extended_gcsfs._cat_ranges([file_path], [0], [10])
+            assert "Falling back to _info() to get the file size" in caplog.text
+            assert result == [json_data[:10]]
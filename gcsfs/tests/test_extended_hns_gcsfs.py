@@ -13,6 +13,7 @@ test_zonal_file.py.
 
 import contextlib
 import os
+import re
 import uuid
 from unittest import mock
 
@@ -22,9 +23,8 @@ from google.cloud import storage_control_v2
 
 from gcsfs.extended_gcsfs import BucketType, ExtendedGcsFileSystem
 from gcsfs.retry import DEFAULT_RETRY_CONFIG, HttpError
-from gcsfs.tests.conftest import requires_hns
+from gcsfs.tests.conftest import is_real_gcs_bucket, requires_hns
 from gcsfs.tests.settings import TEST_HNS_BUCKET
-from gcsfs.tests.utils import is_real_gcs
 
 pytestmark = [requires_hns]
 
@@ -33,6 +33,12 @@ ORIGINAL_GET_BUCKET_TYPE = ExtendedGcsFileSystem._get_bucket_type
 FIXED_UUID = uuid.UUID("00000000-0000-0000-0000-000000000000")
 FIXED_REQUEST_ID = str(FIXED_UUID)
 
+# The underlying API error includes the status code (400) in its string representation.
+PARENT_NOT_FOUND_RE = re.compile(
+    re.escape("HNS rename failed: 400 The parent folder does not exist.")
+)
+SOURCE_NOT_FOUND_RE = re.compile("Source .* not found")
+
 
 def get_mock_folder(folder_path):
     """Helper to create a mock folder object from the Storage Control API."""
@@ -172,8 +178,8 @@ class TestExtendedGcsFileSystemMv:
         file_in_root = f"{path1}/file1.txt"
         nested_file = f"{path1}/sub_dir/file2.txt"
 
-        gcsfs.touch(file_in_root)
-        gcsfs.touch(nested_file)
+        # Create both files concurrently in one batched call.
+        gcsfs.pipe({file_in_root: b"", nested_file: b""})
 
         with gcs_hns_mocks(BucketType.HIERARCHICAL, gcsfs) as mocks:
             # Configure mocks
@@ -192,13 +198,10 @@ class TestExtendedGcsFileSystemMv:
 
             gcsfs.mv(path1, path2)
 
-            # Verify that the old path no longer exist
-            assert not gcsfs.exists(path1)
-
-            # Verify that the new paths exist
-            assert gcsfs.exists(path2)
-            assert gcsfs.exists(f"{path2}/file1.txt")
-            assert gcsfs.exists(f"{path2}/sub_dir/file2.txt")
+            # Verify that the old path no longer exists and the new paths do
+            assert gcsfs.exists_many(
+                [path1, path2, f"{path2}/file1.txt", f"{path2}/sub_dir/file2.txt"]
+            ) == [False, True, True, True]
 
             mocks["async_lookup_bucket_type"].assert_called_once_with(TEST_HNS_BUCKET)
             # Verify the sequence of _info calls for mv and exists checks.
@@ -530,9 +533,7 @@ class TestExtendedGcsFileSystemMv:
 
             gcsfs.touch(f"{path1}/file.txt")
 
-            # The underlying API error includes the status code (400) in its string representation.
-            expected_msg = "HNS rename failed: 400 The parent folder does not exist."
-            with pytest.raises(OSError, match=expected_msg):
+            with pytest.raises(OSError, match=PARENT_NOT_FOUND_RE):
                 gcsfs.mv(path1, path2)
 
             expected_request = self._get_rename_folder_request(path1, path2)
@@ -573,7 +574,7 @@ class TestExtendedGcsFileSystemMv:
                 "Folder not found during rename"
             )
 
-            with pytest.raises(FileNotFoundError, match="Source .* not found"):
+            with pytest.raises(FileNotFoundError, match=SOURCE_NOT_FOUND_RE):
                 gcsfs.mv(path1, path2)
 
             expected_request = self._get_rename_folder_request(path1, path2)
@@ -591,8 +592,7 @@ class TestExtendedGcsFileSystemMv:
         path1 = f"{TEST_HNS_BUCKET}/dir"
         path2 = f"{TEST_HNS_BUCKET}/existing_dir"
 
-        gcsfs.touch(f"{path1}/file.txt")
-        gcsfs.touch(f"{path2}/file.txt")
+        gcsfs.pipe({f"{path1}/file.txt": b"", f"{path2}/file.txt": b""})
 
         with gcs_hns_mocks(BucketType.HIERARCHICAL, gcsfs) as mocks:
             mocks["info"].return_value = {"type": "directory"}
@@ -1166,7 +1166,7 @@ class TestExtendedGcsFileSystemMkdir:
             mocks["super_mkdir"].assert_not_called()
 
     @pytest.mark.skipif(
-        is_real_gcs(),
+        is_real_gcs_bucket,
         reason="This test is only to check that create_folder is not called for non-HNS buckets.",
     )
     def test_mkdir_non_hns_bucket_falls_back(self, gcs_hns, gcs_hns_mocks):
@@ -2170,7 +2170,7 @@ class TestExtendedGcsFileSystemRmdir:
             mocks["super_rmdir"].assert_not_called()
 
     @pytest.mark.skipif(
-        is_real_gcs(),
+        is_real_gcs_bucket,
         reason="This test is only to check that delete_folder is not called in case of non-HNS buckets."
         "In real GCS on non-HNS bucket there would be no empty directories to delete.",
     )
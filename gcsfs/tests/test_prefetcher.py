@@ -4,7 +4,12 @@ from unittest import mock
 import fsspec.asyn
 import pytest
 
-from gcsfs.prefetcher import BackgroundPrefetcher, RunningAverageTracker, _fast_slice
+from gcsfs.prefetcher import (
+    BackgroundPrefetcher,
+    PrefetchConsumer,
+    RunningAverageTracker,
+    _fast_slice,
+)
 
 
 @pytest.fixture
@@ -396,6 +401,23 @@ def test_fast_slice_branch(prefetcher_factory):
     assert bp.fetch(10, 20) == b"X" * 10
 
 
+def test_small_copies_stay_on_event_loop(prefetcher_factory, monkeypatch):
+    data = bytes(range(200))
+    bp = prefetcher_factory(fetcher=MockFetcher(data), size=200, concurrency=4)
+    with mock.patch(
+        "gcsfs.prefetcher.asyncio.to_thread", wraps=asyncio.to_thread
+    ) as to_thread:
+        # Partial block reads slice (and span reads join) the fetched blocks
+        assert bp.fetch(0, 10) == data[:10]
+        assert bp.fetch(10, 13) == data[10:13]
+        assert bp.fetch(13, 25) == data[13:25]
+        to_thread.assert_not_called()
+
+        monkeypatch.setattr(PrefetchConsumer, "MIN_THREAD_COPY_SIZE", 2)
+        assert bp.fetch(25, 28) == data[25:28]
+        to_thread.assert_called()
+
+
 def test_async_fetch_not_block_break(prefetcher_factory):
     bp = prefetcher_factory(fetcher=MockFetcher(b""), size=100, concurrency=4)
 
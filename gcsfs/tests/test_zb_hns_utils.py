@@ -71,6 +71,24 @@ async def test_download_range():
     assert result == expected_data
 
 
+@pytest.mark.asyncio
+async def test_download_range_multiple_chunks():
+    """Tests that download_range joins the chunks MRD writes, and returns a
+    single chunk without copying it."""
+    mock_mrd = mock.AsyncMock()
+    chunks = [b"first ", b"second ", b"third"]
+
+    async def mock_download_ranges(ranges):
+        for chunk in chunks:
+            ranges[0][2].write(chunk)
+
+    mock_mrd.download_ranges.side_effect = mock_download_ranges
+    assert await zb_hns_utils.download_range(0, 18, mock_mrd) == b"".join(chunks)
+
+    chunks = [b"x" * 18]
+    assert await zb_hns_utils.download_range(0, 18, mock_mrd) is chunks[0]
+
+
 @pytest.mark.asyncio
 async def test_init_aaow():
     """
@@ -92,7 +110,7 @@ async def test_init_aaow():
             bucket_name=bucket_name,
             object_name=object_name,
             generation=generation,
-            writer_options={},
+            writer_options=None,
         )
         mock_writer_instance.open.assert_awaited_once()
         assert result is mock_writer_instance
@@ -267,6 +285,37 @@ async def test_download_ranges_unified(ranges, expected_call_count):
             assert hasattr(act_buf, "write")
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "ranges, max_gap, expected_spans",
+    [
+        ([(0, 5), (5, 5)], 0, [(0, 10)]),  # Adjacent
+        ([(10, 5), (0, 12)], 0, [(0, 15)]),  # Overlapping, out of order
+        ([(0, 5), (8, 2)], 0, [(0, 5), (8, 2)]),  # Gap, not merged
+        ([(0, 5), (8, 2)], 3, [(0, 10)]),  # Gap within max_gap
+        ([(2, 3), (2, 3)], 0, [(2, 3)]),  # Duplicate range
+    ],
+    ids=["adjacent", "overlapping", "gap", "gap_within_max", "duplicate"],
+)
+async def test_download_ranges_coalesces(ranges, max_gap, expected_spans):
+    """Tests that touching/overlapping ranges are fetched as one MRD range."""
+    source = bytes(range(32))
+    mock_mrd = mock.AsyncMock()
+
+    async def side_effect(req_ranges):
+        for offset, length, buf in req_ranges:
+            buf.write(source[offset : offset + length])
+
+    mock_mrd.download_ranges.side_effect = side_effect
+
+    results = await zb_hns_utils.download_ranges(ranges, mock_mrd, max_gap=max_gap)
+
+    assert results == [source[off : off + ln] for off, ln in ranges]
+    mock_mrd.download_ranges.assert_awaited_once()
+    actual_args = mock_mrd.download_ranges.call_args[0][0]
+    assert [(off, ln) for off, ln, _ in actual_args] == expected_spans
+
+
 @pytest.mark.asyncio
 async def test_download_ranges_exception():
     """Test exception propagation (Keep separate as it changes control flow)."""
@@ -810,6 +859,67 @@ async def test_mrd_pool_create_failure_decrements_active(
     assert mrd_pool._all_mrds == []
 
 
+@pytest.mark.asyncio
+@mock.patch("gcsfs.zb_hns_utils.init_mrd", new_callable=mock.AsyncMock)
+async def test_mrd_pool_creates_mrds_concurrently(
+    init_mrd_mock, mock_cache, mock_gcsfs
+):
+    """MRD creation happens outside the pool lock, so streams open in parallel."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def slow_init(*args, **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return mock.AsyncMock()
+
+    init_mrd_mock.side_effect = slow_init
+    mrd_pool = MRDPool(mock_gcsfs, "bucket", "obj", "123", True, 2, cache=mock_cache)
+
+    async def use():
+        async with mrd_pool.get_mrd() as mrd:
+            return mrd
+
+    mrds = await asyncio.gather(use(), use())
+
+    assert max_in_flight == 2
+    assert mrds[0] is not mrds[1]
+    assert mrd_pool._active_count == 2
+
+
+@pytest.mark.asyncio
+@mock.patch("gcsfs.zb_hns_utils.init_mrd", new_callable=mock.AsyncMock)
+async def test_mrd_pool_close_during_creation(init_mrd_mock, mock_cache, mock_gcsfs):
+    """An MRD finished after close() is closed instead of being handed out."""
+    created = mock.AsyncMock()
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def blocked_init(*args, **kwargs):
+        started.set()
+        await release.wait()
+        return created
+
+    init_mrd_mock.side_effect = blocked_init
+    mrd_pool = MRDPool(mock_gcsfs, "bucket", "obj", "123", True, 2, cache=mock_cache)
+
+    async def use():
+        async with mrd_pool.get_mrd():
+            pass
+
+    task = asyncio.create_task(use())
+    await started.wait()
+    await mrd_pool.close()
+    release.set()
+
+    with pytest.raises(RuntimeError, match="MRDPool is closed"):
+        await task
+    created.close.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_mrd_pool_close_donates_and_repools(mock_cache):
     captured = []
@@ -16,11 +16,15 @@ from google.cloud.storage.asyncio.async_appendable_object_writer import (
 )
 
 from gcsfs.extended_gcsfs import ExtendedGcsFileSystem
-from gcsfs.tests.conftest import requires_rapid
+from gcsfs.tests.conftest import requires_rapid, runs_rapid_tests
 from gcsfs.tests.settings import TEST_ZONAL_BUCKET
 from gcsfs.tests.utils import is_real_gcs, tempdir, tmpfile
 from gcsfs.zonal_file import ZonalFile
 
+if not runs_rapid_tests:
+    # Every test here is skipped anyway; skip the module at collection time.
+    pytest.skip(requires_rapid.kwargs["reason"], allow_module_level=True)
+
 test_data = b"hello world"
 
 pytestmark = [requires_rapid]
@@ -187,13 +191,74 @@ def test_zonal_file_write_success(extended_gcsfs, zonal_write_mocks, file_path):
         assert f.loc == len(data1) + len(data2)
 
     if zonal_write_mocks:
-        zonal_write_mocks["aaow"].append.assert_has_awaits(
-            [mock.call(data1), mock.call(data2)]
-        )
+        # Small writes are coalesced into a single append on close
+        zonal_write_mocks["aaow"].append.assert_awaited_once_with(data1 + data2)
     else:
         assert extended_gcsfs.cat(file_path) == data1 + data2
 
 
+def test_zonal_file_write_coalesces_until_flush_interval(
+    extended_gcsfs, zonal_write_mocks, file_path
+):
+    """Test that writes are buffered up to flush_interval_bytes before appending."""
+    if not zonal_write_mocks:
+        pytest.skip("Inspects append calls on the mocked writer")
+    flush_interval_bytes = 2 * 1024 * 1024
+    small = b"a" * (flush_interval_bytes // 2)
+    large = b"b" * flush_interval_bytes
+    append = zonal_write_mocks["aaow"].append
+    with extended_gcsfs.open(
+        file_path, "wb", flush_interval_bytes=flush_interval_bytes
+    ) as f:
+        f.write(small)
+        append.assert_not_awaited()
+        f.write(small)
+        f.flush()
+        append.assert_awaited_once_with(small + small)
+
+        # Large writes go straight through when nothing is buffered
+        f.write(large)
+        assert append.await_count == 2
+
+        f.write(b"tail")
+        f.flush()
+        assert append.await_args_list[-1] == mock.call(b"tail")
+        assert f.loc == 2 * len(small) + len(large) + 4
+
+
+def test_zonal_file_write_overlaps_full_buffer_append(
+    extended_gcsfs, zonal_write_mocks, file_path
+):
+    """Test that a full buffer is appended in the background while writing continues."""
+    if not zonal_write_mocks:
+        pytest.skip("Inspects append calls on the mocked writer")
+    flush_interval_bytes = 2 * 1024 * 1024
+    chunk = b"a" * flush_interval_bytes
+    mock_aaow = zonal_write_mocks["aaow"]
+    release = asyncio.Event()
+
+    async def slow_append(data):
+        await release.wait()
+        mock_aaow.offset += len(data)
+
+    mock_aaow.append.side_effect = slow_append
+    with extended_gcsfs.open(
+        file_path, "wb", flush_interval_bytes=flush_interval_bytes
+    ) as f:
+        f.write(b"x")
+        f.write(chunk)
+        # The append was handed to the event loop but write() did not wait for it
+        assert mock_aaow.offset == 0
+        f.write(b"more")
+        extended_gcsfs.loop.call_soon_threadsafe(release.set)
+        f.flush()
+        assert mock_aaow.offset == len(chunk) + 5
+        assert [c.args[0] for c in mock_aaow.append.await_args_list] == [
+            b"x" + chunk,
+            b"more",
+        ]
+
+
 def test_zonal_file_open_write_mode(extended_gcsfs, zonal_write_mocks, file_path):
     """Test that opening a ZonalFile in write mode initializes the writer."""
     bucket, key, _ = extended_gcsfs.split_path(file_path)
@@ -238,8 +303,9 @@ def test_zonal_file_open_append_mode(extended_gcsfs, zonal_write_mocks, file_pat
         f.write(b"data")
 
     if zonal_write_mocks:
-        # check _info is called to get the generation
-        zonal_write_mocks["_gcsfs_info"].assert_awaited_once_with(file_path)
+        # check _get_object is called to get the generation
+        zonal_write_mocks["_gcsfs_get_object"].assert_awaited_once_with(file_path)
+        zonal_write_mocks["_gcsfs_info"].assert_not_awaited()
         zonal_write_mocks["init_aaow"].assert_called_once_with(
             extended_gcsfs.grpc_client,
             bucket,
@@ -258,8 +324,8 @@ def test_zonal_file_open_append_mode_nonexistent_file(
     bucket, key, _ = extended_gcsfs.split_path(file_path)
 
     if zonal_write_mocks:
-        # Configure _info to raise FileNotFoundError to simulate non-existent file
-        extended_gcsfs._info.side_effect = FileNotFoundError
+        # Configure _get_object to raise FileNotFoundError to simulate non-existent file
+        zonal_write_mocks["_gcsfs_get_object"].side_effect = FileNotFoundError
     else:
         try:
             extended_gcsfs.rm(file_path)
@@ -274,8 +340,8 @@ def test_zonal_file_open_append_mode_nonexistent_file(
         zonal_write_mocks["init_aaow"].assert_called_once_with(
             extended_gcsfs.grpc_client, bucket, key, None, _DEFAULT_FLUSH_INTERVAL_BYTES
         )
-        # _info is called to get the generation, but it fails
-        extended_gcsfs._info.assert_awaited_once()
+        # _get_object is called to get the generation, but it fails
+        zonal_write_mocks["_gcsfs_get_object"].assert_awaited_once()
     else:
         assert extended_gcsfs.cat(file_path) == test_data
 
@@ -681,18 +747,21 @@ def test_zonal_file_fetch_range_with_prefetch_engine(mock_sync, mock_gcsfs):
     assert result == b"all_data"
     mock_engine.fetch.assert_called_once_with(0, 10)
 
-    mock_engine.reset_mock()
-    mock_engine.fetch.side_effect = [b"chunk1", b"chunk2"]
+    # Chunked reads are batched into one coroutine on the loop.
+    mock_sync.reset_mock()
+    mock_sync.side_effect = lambda loop, func, *args: asyncio.run(func(*args))
+    mock_engine.afetch = mock.AsyncMock(side_effect=[b"chunk1", b"chunk2"])
     result = zf._fetch_range(start=0, chunk_lengths=[6, 6])
     assert result == [b"chunk1", b"chunk2"]
-    mock_engine.fetch.assert_has_calls([mock.call(0, 6), mock.call(6, 12)])
+    mock_engine.afetch.assert_has_awaits([mock.call(0, 6), mock.call(6, 12)])
+    mock_engine.fetch.assert_called_once_with(0, 10)
+    mock_sync.assert_called_once()
 
-    mock_engine.reset_mock()
-    mock_engine.fetch.side_effect = None
-    mock_engine.fetch.return_value = b"short"
+    mock_engine.afetch = mock.AsyncMock(return_value=b"short")
 
     result = zf._fetch_range(start=0, chunk_lengths=[10])
     assert result == [b""]
+    mock_sync.side_effect = None
     zf.close()
 
 
@@ -821,9 +890,14 @@ def test_zonal_file_fetch_range_unhandled_runtime_error(mock_sync, mock_gcsfs):
     with pytest.raises(RuntimeError, match="A completely different error occurred"):
         zf._fetch_range(start=0, end=10)
 
+    mock_sync.side_effect = lambda loop, func, *args: asyncio.run(func(*args))
+    mock_engine.afetch = mock.AsyncMock(
+        side_effect=RuntimeError("A completely different error occurred")
+    )
     with pytest.raises(RuntimeError, match="A completely different error occurred"):
         zf._fetch_range(start=0, chunk_lengths=[10])
 
+    mock_sync.side_effect = None
     zf.close()
 
 
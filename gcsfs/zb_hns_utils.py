@@ -7,7 +7,6 @@ import logging
 import os
 import threading
 import weakref
-from io import BytesIO
 
 from google.api_core.exceptions import NotFound
 from google.cloud.storage.asyncio.async_appendable_object_writer import (
@@ -42,6 +41,27 @@ except Exception:
     HAS_CPYTHON_API = False
 
 
+class _ChunkBuffer:
+    """Write-only buffer that keeps the chunks MRD writes into it.
+
+    MRD only ever calls ``write()`` with the bytes of each response. Holding on
+    to them avoids growing a BytesIO: a range served by one response is
+    returned without copying, and several are joined once at their exact size.
+    """
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(data)
+        return len(data)
+
+    def getvalue(self):
+        if len(self._chunks) == 1 and type(self._chunks[0]) is bytes:
+            return self._chunks[0]
+        return b"".join(self._chunks)
+
+
 async def init_mrd(grpc_client, bucket_name, object_name, generation=None):
     """
     Creates the AsyncMultiRangeDownloader using an existing client.
@@ -64,7 +84,7 @@ async def download_range(offset, length, mrd):
     # If length = 0, mrd returns till end of file, so handle that case here
     if length == 0:
         return b""
-    buffer = BytesIO()
+    buffer = _ChunkBuffer()
     await mrd.download_ranges([(offset, length, buffer)])
     data = buffer.getvalue()
     bytes_downloaded = len(data)
@@ -75,48 +95,70 @@ async def download_range(offset, length, mrd):
             f"Requested {length} bytes but downloaded {bytes_downloaded} bytes."
         )
 
-    logger.debug(
-        f"Requested {length} bytes from offset {offset}, downloaded {bytes_downloaded} "
-        f"bytes from mrd path: {mrd.bucket_name}/{mrd.object_name}"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"Requested {length} bytes from offset {offset}, downloaded "
+            f"{bytes_downloaded} bytes from mrd path: "
+            f"{mrd.bucket_name}/{mrd.object_name}"
+        )
     return data
 
 
-async def download_ranges(ranges, mrd):
+async def download_ranges(ranges, mrd, max_gap=0):
     """
     Downloads multiple byte ranges from the file asynchronously in a single batch.
 
+    Overlapping ranges, and ranges separated by at most ``max_gap`` bytes, are
+    coalesced into one span before calling MRD, so each span costs a single
+    range on the stream and shared bytes are fetched only once.
+
     Args:
         ranges: List of (offset, length) tuples to download. Max 1000 ranges allowed.
         mrd: AsyncMultiRangeDownloader instance
+        max_gap: Largest gap, in bytes, between two ranges that are still merged.
+            The default of 0 only merges ranges that touch or overlap.
 
     Returns:
         List of bytes objects, one for each range
     """
-    # Prepare tasks: Filter out empty ranges and create buffers immediately
-    # Structure: (original_index, offset, length, buffer)
     # Calling MRD with length=0 returns till end of file. We handle zero-length
-    # ranges by returning b"" without calling MRD. So only create tasks for length > 0
+    # ranges by returning b"" without calling MRD. So only coalesce ranges with
+    # length > 0.
 
     if len(ranges) > MRD_MAX_RANGES:
         raise ValueError("Invalid input - number of ranges cannot be more than 1000")
 
-    tasks = [
-        (i, off, length, BytesIO())
-        for i, (off, length) in enumerate(ranges)
-        if length > 0
-    ]
+    # Structure: [span_start, span_end, [original indices]]
+    spans = []
+    for i in sorted(
+        (i for i, (_, length) in enumerate(ranges) if length > 0),
+        key=lambda i: ranges[i][0],
+    ):
+        off, length = ranges[i]
+        if spans and off <= spans[-1][1] + max_gap:
+            spans[-1][1] = max(spans[-1][1], off + length)
+            spans[-1][2].append(i)
+        else:
+            spans.append([off, off + length, [i]])
+    buffers = [_ChunkBuffer() for _ in spans]
 
     # Execute Download
-    if tasks:
-        # The MRD expects list of (offset, length, buffer)
-        # We extract these from our task list
-        await mrd.download_ranges([(off, length, buf) for _, off, length, buf in tasks])
+    if spans:
+        await mrd.download_ranges(
+            [(start, end - start, buf) for (start, end, _), buf in zip(spans, buffers)]
+        )
 
-    # Map results back to their original positions
+    # Slice each span back into the ranges it covers, in their original positions.
+    # A span served by a single response is returned as-is, without copying.
     results = [b""] * len(ranges)
-    for i, _, _, buffer in tasks:
-        results[i] = buffer.getvalue()
+    for (start, _, members), buffer in zip(spans, buffers):
+        data = buffer.getvalue()
+        if len(members) == 1:
+            results[members[0]] = data
+            continue
+        for i in members:
+            rel = ranges[i][0] - start
+            results[i] = data[rel : rel + ranges[i][1]]
 
     # Log stats
     total_requested = sum(r[1] for r in ranges)
@@ -146,11 +188,11 @@ async def init_aaow(
     """
     Creates and opens the AsyncAppendableObjectWriter.
     """
-    writer_options = {}
     # Only pass flush_interval_bytes if the user explicitly provided a
-    # non-default flush interval.
+    # non-default flush interval; otherwise let the writer use its defaults.
+    writer_options = None
     if flush_interval_bytes and flush_interval_bytes != _DEFAULT_FLUSH_INTERVAL_BYTES:
-        writer_options["FLUSH_INTERVAL_BYTES"] = flush_interval_bytes
+        writer_options = {"FLUSH_INTERVAL_BYTES": flush_interval_bytes}
     writer = AsyncAppendableObjectWriter(
         client=grpc_client,
         bucket_name=bucket_name,
@@ -595,6 +637,7 @@ class MRDPool:
             Exception: Bubbles up any exceptions encountered during MRD creation.
         """
         mrd = None
+        create = False
 
         async with self._lock:
             if self._closed:
@@ -602,12 +645,11 @@ class MRDPool:
 
             if self._free_mrds.empty():
                 if self._active_count < self.pool_size:
+                    # Reserve the slot under the lock but open the stream after
+                    # releasing it, so concurrent callers create their MRDs in
+                    # parallel instead of queueing behind each other's RPCs.
                     self._active_count += 1
-                    try:
-                        mrd = await self._get_or_create_mrd()
-                    except BaseException as e:
-                        self._active_count -= 1
-                        raise e
+                    create = True
                 elif self._all_mrds:
                     # Pool is full and the queue is empty: share a busy MRD in
                     # round-robin fashion. The MRD now has multiple holders;
@@ -616,7 +658,7 @@ class MRDPool:
                     mrd = self._all_mrds[self._rr_index]
                     self._rr_index = (self._rr_index + 1) % len(self._all_mrds)
 
-            if mrd is None:
+            if mrd is None and not create:
                 # If the queue was non-empty, this gets an MRD immediately without blocking.
                 # If the queue was empty (pool is full and sharing is disabled), this blocks
                 # until a holder returns an MRD.
@@ -625,6 +667,19 @@ class MRDPool:
                 # here is still unblocked by a concurrent release (no deadlock).
                 mrd = await self._free_mrds.get()
 
+            if mrd is not None:
+                self._mark_inflight(mrd)
+
+        if create:
+            try:
+                mrd = await self._get_or_create_mrd()
+            except BaseException as e:
+                self._active_count -= 1
+                raise e
+            if self._closed:
+                # close() ran while the stream was being opened.
+                await close_mrd(mrd)
+                raise RuntimeError("MRDPool is closed.")
             self._mark_inflight(mrd)
 
         try:
@@ -1,3 +1,5 @@
+import asyncio
+import io
 import logging
 
 from fsspec import asyn
@@ -62,6 +64,8 @@ class ZonalFile(GCSFile):
         if not key:
             raise OSError("Attempt to open a bucket")
         self.aaow = None
+        self._pending_append = None
+        self.mrd_pool = None
         self.finalize_on_close = finalize_on_close
         self.finalized = False
         self.mode = mode
@@ -135,8 +139,10 @@ class ZonalFile(GCSFile):
         # generation is needed while creating aaow to append to existing objects
         if "a" in self.mode and generation is None:
             try:
-                # self.path might not be set yet, so reconstruct full path
-                info = await self.gcsfs._info(f"{bucket_name}/{object_name}")
+                # self.path might not be set yet, so reconstruct full path.
+                # Only the object itself matters here, so _get_object avoids
+                # the directory lookup that _info runs alongside it.
+                info = await self.gcsfs._get_object(f"{bucket_name}/{object_name}")
                 generation = info.get("generation")
             except FileNotFoundError:
                 # if file doesn't exist, we don't need generation
@@ -198,19 +204,14 @@ class ZonalFile(GCSFile):
                 if chunk_lengths is None:
                     return self._prefetch_engine.fetch(start, end)
 
-                # Fetch chunks sequentially through the prefetch engine
-                # Spawning concurrent task is worst here, because that would act as seek for prefetcher.
-                results = []
-                current_offset = start if start is not None else 0
-                for length in chunk_lengths:
-                    data = self._prefetch_engine.fetch(
-                        current_offset, current_offset + length
-                    )
-                    results.append(data)
-                    current_offset += length
-                    if length != len(data):
-                        raise RuntimeError("not satisfiable")
-                return results
+                # Fetch chunks sequentially through the prefetch engine, in a
+                # single hop onto the event loop rather than one per chunk.
+                return asyn.sync(
+                    self._prefetch_engine.loop,
+                    self._prefetch_fetch_chunks,
+                    start,
+                    chunk_lengths,
+                )
             except RuntimeError as e:
                 if "not satisfiable" in str(e):
                     return b"" if chunk_lengths is None else [b""]
@@ -243,6 +244,20 @@ class ZonalFile(GCSFile):
                 return b"" if chunk_lengths is None else [b""]
             raise
 
+    async def _prefetch_fetch_chunks(self, start, chunk_lengths):
+        # Spawning concurrent task is worst here, because that would act as seek for prefetcher.
+        results = []
+        current_offset = start if start is not None else 0
+        for length in chunk_lengths:
+            data = await self._prefetch_engine.afetch(
+                current_offset, current_offset + length
+            )
+            results.append(data)
+            current_offset += length
+            if length != len(data):
+                raise RuntimeError("not satisfiable")
+        return results
+
     async def _async_fetch_range(self, start_offset, total_size, split_factor=1):
         """The native coroutine called by the BackgroundPrefetcher."""
         return await self.gcsfs._concurrent_mrd_fetch(
@@ -266,11 +281,46 @@ class ZonalFile(GCSFile):
         # Lazily initialize the AsyncAppendableObjectWriter on the first write to avoid
         # unnecessary object creation for files that are opened but never written to.
         self._ensure_aaow()
-        asyn.sync(self.gcsfs.loop, self.aaow.append, data)
         bytes_written = len(data)
+        if not self.buffer.tell() and bytes_written >= self.flush_interval_bytes:
+            # The caller owns data and may reuse it once we return, so this
+            # append is not left in flight.
+            self._wait_for_append()
+            asyn.sync(self.gcsfs.loop, self.aaow.append, data)
+        else:
+            # Coalesce small writes so that each one does not become its own
+            # append (and persist) round trip.
+            self.buffer.write(data)
+            if self.buffer.tell() >= self.flush_interval_bytes:
+                self._append_buffer(wait=False)
         self.loc += bytes_written
         return bytes_written
 
+    def _append_buffer(self, wait=True):
+        """
+        Sends any coalesced writes to the AsyncAppendableObjectWriter.
+
+        With ``wait=False`` the append is left running on the event loop so the
+        caller can fill the next buffer meanwhile. Appends on a writer must not
+        overlap, so at most one is in flight and it is waited on before the
+        next one is sent.
+        """
+        if self.buffer.tell():
+            data = self.buffer.getvalue()
+            self.buffer = io.BytesIO()
+            self._wait_for_append()
+            self._pending_append = asyncio.run_coroutine_threadsafe(
+                self.aaow.append(data), self.gcsfs.loop
+            )
+        if wait:
+            self._wait_for_append()
+
+    def _wait_for_append(self):
+        """Waits for the in-flight append, if any, re-raising its error."""
+        if self._pending_append is not None:
+            pending, self._pending_append = self._pending_append, None
+            pending.result()
+
     def flush(self, force=False):
         """
         Flushes the AsyncAppendableObjectWriter, sending all buffered data
@@ -299,6 +349,7 @@ class ZonalFile(GCSFile):
         # We must ensure aaow exists so that the file is created even for empty writes,
         # and to flush any buffered data if it exists.
         self._ensure_aaow()
+        self._append_buffer()
 
         asyn.sync(self.gcsfs.loop, self.aaow.flush)
 
@@ -316,6 +367,7 @@ class ZonalFile(GCSFile):
             return
 
         self._ensure_aaow()
+        self._append_buffer()
         asyn.sync(self.gcsfs.loop, self.aaow.finalize)
         self.finalized = True
         # File is already finalized, avoid finalizing again on close
@@ -385,7 +437,7 @@ class ZonalFile(GCSFile):
         # super is closed before aaow since flush may need aaow
         super().close()
 
-        if hasattr(self, "mrd_pool") and self.mrd_pool:
+        if self.mrd_pool:
             asyn.sync(self.gcsfs.loop, self.mrd_pool.close)
 
         # Only close aaow if the stream is open